@@ -1,8 +1,21 @@
 """Kubectl wrapper utilities."""
 
+import asyncio
+import atexit
+import http.client
 import json
+import re
 import subprocess
-from typing import Dict, List, Optional, Any
+import threading
+import time
+import yaml
+from types import MappingProxyType
+from typing import Dict, Hashable, Iterable, List, Mapping, NamedTuple, Optional, Any, Set, Tuple
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads as _json_loads
 
 
 class KubectlError(Exception):
@@ -10,12 +23,193 @@ class KubectlError(Exception):
     pass
 
 
+class _TTLCache:
+    """Small thread-safe mapping whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        with self._lock:
+            if key not in self._data and len(self._data) >= self._maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self._ttl, value)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop a cached value if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._data.clear()
+
+
+class KubectlProxy:
+    """Long-lived ``kubectl proxy`` used to create resources over HTTP.
+
+    The proxy is started on first use and its local port is reused, so
+    creating a resource is an HTTP POST on a keep-alive connection rather
+    than a fresh kubectl process per resource. If the proxy fails to
+    start, no new start is attempted for ``retry_after`` seconds.
+    """
+
+    # kubectl prints "Starting to serve on 127.0.0.1:<port>" once listening
+    _PORT_PATTERN = re.compile(rb":(\d+)\s*$")
+
+    def __init__(self, retry_after: float = 60.0) -> None:
+        self._process: Optional[subprocess.Popen] = None
+        self._port: Optional[int] = None
+        self._lock = threading.Lock()
+        self._idle: List[http.client.HTTPConnection] = []
+        self._retry_after = retry_after
+        self._retry_at = 0.0
+
+    def _ensure_started(self) -> int:
+        """Start kubectl proxy if it is not running and return its port.
+
+        Raises:
+            ConnectionError: If the proxy cannot be started, or failed to
+                start within the last ``retry_after`` seconds
+        """
+        with self._lock:
+            if self._process is not None and self._process.poll() is None:
+                return self._port
+
+            if time.monotonic() < self._retry_at:
+                raise ConnectionError("kubectl proxy failed to start recently")
+
+            self._idle.clear()
+            try:
+                process = subprocess.Popen(
+                    ["kubectl", "proxy", "--port=0"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                )
+            except OSError as e:
+                self._retry_at = time.monotonic() + self._retry_after
+                raise ConnectionError(f"kubectl proxy could not be started: {e}") from e
+
+            match = self._PORT_PATTERN.search(process.stdout.readline())
+            if not match:
+                process.kill()
+                process.wait()
+                self._retry_at = time.monotonic() + self._retry_after
+                raise ConnectionError("kubectl proxy did not report a listening port")
+
+            self._process = process
+            self._port = int(match.group(1))
+            return self._port
+
+    def stop(self) -> None:
+        """Terminate the proxy process if it was started."""
+        with self._lock:
+            if self._process is not None and self._process.poll() is None:
+                self._process.terminate()
+            self._process = None
+            self._idle.clear()
+
+    def _post(self, path: str, body: bytes) -> Tuple[int, bytes]:
+        """POST to the proxy on an idle keep-alive connection.
+
+        Returns:
+            Tuple of HTTP status code and response body
+        """
+        port = self._ensure_started()
+        try:
+            conn = self._idle.pop()
+        except IndexError:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+
+        try:
+            conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+            response = conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            raise
+
+        self._idle.append(conn)
+        return response.status, data
+
+    def create(self, yaml_content: str, namespace: str = "default") -> Dict[str, Any]:
+        """Create the resource described by a YAML document.
+
+        This is a create (POST), not an apply. If the resource already
+        exists (HTTP 409), the document goes through ``kubectl apply``
+        instead, so callers keep apply semantics.
+
+        Args:
+            yaml_content: YAML content as string (single document)
+            namespace: Namespace used when the document does not set one
+
+        Returns:
+            Result dictionary with status and details
+
+        Raises:
+            KubectlError: If the API server rejects the resource
+            OSError: If the proxy cannot be started or reached
+        """
+        doc = yaml.safe_load(yaml_content)
+        kind = doc["kind"].lower()
+        name = doc["metadata"]["name"]
+        namespace = doc["metadata"].get("namespace", namespace)
+        group = doc["apiVersion"].split("/")[0]
+
+        # Chaos Mesh CRD plurals are the lowercase kind (e.g. networkchaos)
+        path = f"/apis/{doc['apiVersion']}/namespaces/{namespace}/{kind}"
+        status, data = self._post(path, json.dumps(doc).encode())
+
+        if status == 409:
+            return apply_yaml(yaml_content)
+        if status >= 300:
+            try:
+                message = json.loads(data).get("message", "")
+            except ValueError:
+                message = data.decode(errors="replace")
+            raise KubectlError(f"kubectl apply failed: {message}")
+
+        return {
+            "status": "applied",
+            "output": f"{kind}.{group}/{name} created"
+        }
+
+
+_proxy = KubectlProxy()
+atexit.register(_proxy.stop)
+
+
+_get_command_cache = _TTLCache(maxsize=64, ttl=2.0)
+
+
 class KubectlRunner:
     """Async kubectl command runner for validation and operations."""
 
     async def run_command(self, command: str) -> Dict[str, Any]:
         """Run kubectl command and return JSON output.
 
+        Read-only ``get`` commands are shared for a couple of seconds, so
+        validation checks that fetch the same resources (e.g. the
+        chaos-mesh pods) run kubectl only once, even when issued
+        concurrently.
+
         Args:
             command: kubectl command (without 'kubectl' prefix)
 
@@ -25,22 +219,50 @@ class KubectlRunner:
         Raises:
             KubectlError: If command fails
         """
-        cmd = ["kubectl"] + command.split()
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            raise KubectlError(f"kubectl {command} failed: {result.stderr}")
+        if not command.startswith("get "):
+            return await self._execute(command)
+
+        # Tasks belong to one event loop, so each loop shares its own
+        key = (asyncio.get_running_loop(), command)
+        task = _get_command_cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._execute(command))
+            _get_command_cache.set(key, task)
+        try:
+            return await asyncio.shield(task)
+        except BaseException:
+            # Do not keep failed or cancelled lookups around; the next
+            # call retries. A caller cancelled while the shared lookup is
+            # still running leaves it for the other callers.
+            if task.done():
+                _get_command_cache.pop(key)
+            raise
+
+    async def _execute(self, command: str) -> Dict[str, Any]:
+        process = await asyncio.create_subprocess_exec(
+            "kubectl", *command.split(),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout_bytes, stderr_bytes = await process.communicate()
+        stdout = stdout_bytes.decode()
+
+        if process.returncode != 0:
+            raise KubectlError(f"kubectl {command} failed: {stderr_bytes.decode()}")
 
         # Try to parse as JSON
         try:
-            return json.loads(result.stdout)
+            return json.loads(stdout)
         except json.JSONDecodeError:
             # Return raw output for non-JSON commands
-            return {"output": result.stdout.strip()}
+            return {"output": stdout.strip()}
 
     async def apply_yaml(self, yaml_content: str, namespace: str = "default") -> Dict[str, Any]:
         """Apply YAML content using kubectl.
 
+        Resources are created through a shared kubectl proxy. If the proxy
+        cannot be started or reached, falls back to ``kubectl apply -f -``.
+
         Args:
             yaml_content: YAML content as string
             namespace: Target namespace
@@ -51,8 +273,11 @@ class KubectlRunner:
         Raises:
             KubectlError: If apply fails
         """
-        result = apply_yaml(yaml_content)
-        return result
+        # Run in a worker thread so concurrent applies overlap
+        try:
+            return await asyncio.to_thread(_proxy.create, yaml_content, namespace)
+        except (OSError, http.client.HTTPException):
+            return await asyncio.to_thread(apply_yaml, yaml_content)
 
 
 def apply_yaml(yaml_content: str) -> Dict[str, Any]:
@@ -67,21 +292,163 @@ def apply_yaml(yaml_content: str) -> Dict[str, Any]:
     Raises:
         KubectlError: If kubectl command fails
     """
-    result = subprocess.run(
+    return apply_yaml_documents((yaml_content,))
+
+
+def apply_yaml_documents(documents: Iterable[str]) -> Dict[str, Any]:
+    """Apply YAML documents through a single ``kubectl apply -f -`` stream.
+
+    Documents are written to kubectl's stdin one at a time, separated by
+    ``---``, instead of being joined into one string first.
+
+    Args:
+        documents: YAML documents as strings
+
+    Returns:
+        Result dictionary with status and details
+
+    Raises:
+        KubectlError: If kubectl command fails
+    """
+    process = subprocess.Popen(
         ["kubectl", "apply", "-f", "-"],
-        input=yaml_content.encode(),
-        capture_output=True
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
     )
 
-    if result.returncode != 0:
-        raise KubectlError(f"kubectl apply failed: {result.stderr.decode()}")
+    try:
+        for i, document in enumerate(documents):
+            if i:
+                process.stdin.write(b"\n---\n")
+            process.stdin.write(document.encode())
+    except BrokenPipeError:
+        pass  # kubectl exited early; its error is reported below
+
+    # communicate() flushes and closes stdin
+    stdout, stderr = process.communicate()
+
+    if process.returncode != 0:
+        raise KubectlError(f"kubectl apply failed: {stderr.decode()}")
 
     return {
         "status": "applied",
-        "output": result.stdout.decode().strip()
+        "output": stdout.decode().strip()
     }
 
 
+class _PendingBatch:
+    """Documents waiting to be applied together, for one event loop."""
+
+    __slots__ = ("items", "timer")
+
+    def __init__(self) -> None:
+        self.items: List[Tuple[str, "asyncio.Future[Dict[str, Any]]"]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class YamlApplyBatcher:
+    """Coalesce concurrent applies into a single ``kubectl apply -f -`` call.
+
+    Documents submitted within ``max_wait_ms`` of each other (up to
+    ``max_batch`` of them) are streamed into one kubectl process, so
+    a burst of experiments costs one kubectl process instead of one each.
+    If the combined apply fails, each document is re-applied on its own
+    so every caller gets its own result or error. Apply is idempotent, so
+    documents that already went through are reported as unchanged.
+
+    Pending documents are kept per event loop, and documents whose caller
+    was cancelled before the flush are not applied.
+    """
+
+    def __init__(self, max_batch: int = 16, max_wait_ms: float = 50) -> None:
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._batches: Dict[asyncio.AbstractEventLoop, _PendingBatch] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def _batch_for(self, loop: asyncio.AbstractEventLoop) -> _PendingBatch:
+        batch = self._batches.get(loop)
+        if batch is None:
+            # Forget state left behind by loops that have since closed
+            for closed in [l for l in self._batches if l.is_closed()]:
+                del self._batches[closed]
+            batch = self._batches[loop] = _PendingBatch()
+        return batch
+
+    async def submit(self, yaml_content: str) -> Dict[str, Any]:
+        """Queue YAML content for the next batched apply.
+
+        Args:
+            yaml_content: YAML content as string
+
+        Returns:
+            Result dictionary with status and details
+
+        Raises:
+            KubectlError: If kubectl apply fails for this document
+            OSError: If kubectl cannot be run
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._batch_for(loop)
+        future = loop.create_future()
+        batch.items.append((yaml_content, future))
+
+        if len(batch.items) >= self.max_batch:
+            self._flush(batch)
+        elif batch.timer is None:
+            batch.timer = loop.call_later(self.max_wait, self._flush, batch)
+
+        return await future
+
+    def _flush(self, batch: _PendingBatch) -> None:
+        if batch.timer is not None:
+            batch.timer.cancel()
+            batch.timer = None
+
+        items, batch.items = batch.items, []
+        task = asyncio.create_task(self._apply_batch(items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _apply_batch(self, batch: List[Tuple[str, "asyncio.Future[Dict[str, Any]]"]]) -> None:
+        # Skip documents whose caller was cancelled while waiting
+        batch = [(doc, future) for doc, future in batch if not future.done()]
+        if len(batch) > 1:
+            try:
+                result = await asyncio.to_thread(
+                    apply_yaml_documents, [doc for doc, _ in batch]
+                )
+            except Exception:
+                # Includes OSError from Popen; each document is retried below
+                pass
+            else:
+                # kubectl prints one line per document, in input order
+                lines = result["output"].splitlines()
+                if len(lines) != len(batch):
+                    lines = [result["output"]] * len(batch)
+                for (_, future), line in zip(batch, lines):
+                    if not future.done():
+                        future.set_result({"status": "applied", "output": line})
+                return
+
+        await asyncio.gather(*(self._apply_one(doc, future) for doc, future in batch))
+
+    @staticmethod
+    async def _apply_one(yaml_content: str, future: "asyncio.Future[Dict[str, Any]]") -> None:
+        try:
+            result = await asyncio.to_thread(apply_yaml, yaml_content)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+
+apply_batcher = YamlApplyBatcher(max_batch=16, max_wait_ms=50)
+
+
 def validate_yaml(yaml_content: str) -> Dict[str, Any]:
     """Validate YAML using kubectl dry-run.
 
@@ -147,12 +514,13 @@ def list_resources(kind: str, namespace: str = "default", labels: Optional[Dict[
         label_str = ",".join([f"{k}={v}" for k, v in labels.items()])
         cmd.extend(["-l", label_str])
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # Keep stdout as bytes: orjson parses bytes directly, skipping a decode pass
+    result = subprocess.run(cmd, capture_output=True)
 
     if result.returncode != 0:
         return []
 
-    data = json.loads(result.stdout)
+    data = _json_loads(result.stdout)
     return data.get("items", [])
 
 
@@ -198,26 +566,147 @@ def get_pods(namespace: str, labels: Dict[str, str]) -> List[Dict[str, Any]]:
     return list_resources("pod", namespace=namespace, labels=labels)
 
 
-def check_target_exists(namespace: str, labels: Dict[str, str]) -> Dict[str, Any]:
+class TargetCheck(NamedTuple):
+    """Result of looking up the pods matched by a label selector.
+
+    Fully immutable, so cached results can be shared between callers.
+    """
+
+    exists: bool
+    count: int
+    pods: Tuple[Mapping[str, str], ...]
+    pod_names: Tuple[str, ...]
+
+
+# One "<name>\t<phase>" line per pod instead of the full pod JSON
+_POD_NAME_PHASE_JSONPATH = '{range .items[*]}{.metadata.name}{"\\t"}{.status.phase}{"\\n"}{end}'
+
+
+def _fetch_target_pods(namespace: str, labels: Dict[str, str]) -> TargetCheck:
+    """Query kubectl for target pods.
+
+    Only pod names and phases are requested from the API server, so the
+    output is parsed line by line instead of as full pod JSON.
+
+    Args:
+        namespace: Kubernetes namespace
+        labels: Label selectors
+
+    Returns:
+        TargetCheck with existence info, pod list and pod names
+    """
+    cmd = ["kubectl", "get", "pods", "-n", namespace, "-o", f"jsonpath={_POD_NAME_PHASE_JSONPATH}"]
+
+    if labels:
+        label_str = ",".join([f"{k}={v}" for k, v in labels.items()])
+        cmd.extend(["-l", label_str])
+
+    result = subprocess.run(cmd, capture_output=True, text=True)
+
+    pods = []
+    pod_names = []
+    if result.returncode == 0:
+        for line in result.stdout.splitlines():
+            if not line:
+                continue
+            pod_name, _, phase = line.partition("\t")
+            pods.append(MappingProxyType({"name": pod_name, "status": phase}))
+            pod_names.append(pod_name)
+
+    return TargetCheck(
+        exists=len(pods) > 0,
+        count=len(pods),
+        pods=tuple(pods),
+        pod_names=tuple(pod_names)
+    )
+
+
+# Target checks are reused for a few seconds so back-to-back experiments
+# on the same selector skip the kubectl round-trip
+_target_cache = _TTLCache(maxsize=256, ttl=5.0)
+
+
+def _target_cache_key(namespace: str, labels: Dict[str, str]) -> Tuple[str, frozenset]:
+    """Build a hashable cache key from a namespace and label selector."""
+    return namespace, frozenset(labels.items())
+
+
+def check_target_exists(namespace: str, labels: Dict[str, str]) -> TargetCheck:
     """Check if target pods exist.
 
+    Found pods are cached per namespace and label selector for a few seconds.
+    Use get_pods when the full pod objects are needed.
+
     Args:
         namespace: Kubernetes namespace
         labels: Label selectors
 
     Returns:
-        Dictionary with existence info and pod list
+        TargetCheck with existence info, pod list and pod names
     """
-    pods = get_pods(namespace, labels)
+    key = _target_cache_key(namespace, labels)
+    target_check = _target_cache.get(key)
+    if target_check is None:
+        target_check = _fetch_target_pods(namespace, labels)
+        # Misses are not cached so a retry right after deploying the pods works
+        if target_check.exists:
+            _target_cache.set(key, target_check)
+    return target_check
 
-    return {
-        "exists": len(pods) > 0,
-        "count": len(pods),
-        "pods": [
-            {
-                "name": p["metadata"]["name"],
-                "status": p["status"]["phase"]
-            }
-            for p in pods
-        ]
-    }
+
+def invalidate_target_cache(namespace: str, labels: Dict[str, str]) -> None:
+    """Forget the cached target check for a selector.
+
+    Call after applying chaos that can change which pods match, such as
+    pod kills.
+
+    Args:
+        namespace: Kubernetes namespace
+        labels: Label selectors
+    """
+    _target_cache.pop(_target_cache_key(namespace, labels))
+
+
+def assume_target_exists() -> TargetCheck:
+    """Build a target check result without querying the cluster.
+
+    Used when the caller already knows the target pods exist and opts out
+    of check_target_exists; the pod list is left empty.
+
+    Returns:
+        TargetCheck with an empty pod list
+    """
+    return TargetCheck(exists=True, count=0, pods=(), pod_names=())
+
+
+def _consume_exception(future: "asyncio.Future[Any]") -> None:
+    """Mark a background lookup's exception as retrieved if nobody awaits it."""
+    if not future.cancelled():
+        future.exception()
+
+
+def start_target_check(namespace: str, labels: Dict[str, str], skip: bool = False) -> "asyncio.Future[TargetCheck]":
+    """Start a target check in a worker thread and return its future.
+
+    The kubectl call is submitted immediately, so it overlaps with
+    whatever the caller does before awaiting the future (typically
+    parameter validation). Cancel the future if that work fails.
+
+    Args:
+        namespace: Kubernetes namespace
+        labels: Label selectors
+        skip: Resolve immediately with assume_target_exists() instead
+
+    Returns:
+        Future resolving to the target check result
+    """
+    loop = asyncio.get_running_loop()
+
+    if skip:
+        future = loop.create_future()
+        future.set_result(assume_target_exists())
+        return future
+
+    future = loop.run_in_executor(None, check_target_exists, namespace, labels)
+    future.add_done_callback(_consume_exception)
+    return future
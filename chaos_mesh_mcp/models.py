@@ -0,0 +1,57 @@
+"""Result types returned by Chaos Mesh tools."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(slots=True)
+class ChaosResult:
+    """Details of a created chaos experiment.
+
+    Optional fields left as None are omitted from to_dict(), so each tool
+    only reports the fields that apply to its chaos kind.
+    """
+
+    experiment_id: str
+    kind: str
+    namespace: str
+    parameters: Dict[str, Any]
+    action: Optional[str] = None
+    stressor: Optional[str] = None
+    experiment_ids: Optional[List[str]] = None
+    affected_pods: Optional[List[str]] = None
+    target_mode: Optional[str] = None
+    targets: Any = None
+    duration: Optional[str] = None
+    status: Any = None
+    warning: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary for the MCP response.
+
+        Returns:
+            Result dictionary
+        """
+        result = {"experiment_id": self.experiment_id}
+        if self.experiment_ids is not None:
+            result["experiment_ids"] = self.experiment_ids
+        result["kind"] = self.kind
+        if self.action is not None:
+            result["action"] = self.action
+        if self.stressor is not None:
+            result["stressor"] = self.stressor
+        result["namespace"] = self.namespace
+        if self.affected_pods is not None:
+            result["affected_pods"] = self.affected_pods
+        if self.target_mode is not None:
+            result["target_mode"] = self.target_mode
+        if self.targets is not None:
+            result["targets"] = self.targets
+        result["parameters"] = self.parameters
+        if self.duration is not None:
+            result["duration"] = self.duration
+        if self.status is not None:
+            result["status"] = self.status
+        if self.warning is not None:
+            result["warning"] = self.warning
+        return result
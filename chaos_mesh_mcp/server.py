@@ -5,6 +5,8 @@ from mcp.server import Server
 from mcp.types import Tool, TextContent
 from mcp.server.stdio import stdio_server
 
+from .models import ChaosResult
+
 from .tools.network import (
     create_network_delay,
     create_network_loss,
@@ -462,6 +464,7 @@ def get_tools() -> list[Tool]:
                     "mode": {"type": "string", "description": "Selection mode (default: 'one')"},
                     "workers": {"type": "integer", "description": "Number of CPU stress workers (default: 1)"},
                     "load": {"type": "integer", "description": "CPU load percentage 0-100 per worker"},
+                    "fan_out": {"type": "boolean", "description": "With mode 'all', create one resource per address and apply them concurrently; delete every id in experiment_ids to stop it (default: false)"},
                 },
                 "required": ["namespace", "duration"]
             }
@@ -485,6 +488,7 @@ def get_tools() -> list[Tool]:
                     },
                     "mode": {"type": "string", "description": "Default: 'one'"},
                     "size": {"type": "string", "description": "Memory size to allocate (e.g., '256MB', '1GB'). If not specified, allocates all available memory."},
+                    "fan_out": {"type": "boolean", "description": "With mode 'all', create one resource per address and apply them concurrently; delete every id in experiment_ids to stop it (default: false)"},
                 },
                 "required": ["namespace", "duration"]
             }
@@ -510,6 +514,7 @@ def get_tools() -> list[Tool]:
                     },
                     "mode": {"type": "string", "description": "Default: 'one'"},
                     "fill_by_fallocate": {"type": "boolean", "description": "Use fallocate for faster filling (default: true)"},
+                    "fan_out": {"type": "boolean", "description": "With mode 'all', create one resource per address and apply them concurrently; delete every id in experiment_ids to stop it (default: false)"},
                 },
                 "required": ["namespace", "duration", "path", "size"]
             }
@@ -534,6 +539,7 @@ def get_tools() -> list[Tool]:
                     },
                     "mode": {"type": "string", "description": "Default: 'one'"},
                     "signal": {"type": "integer", "description": "Signal number to send (default: 9 for SIGKILL). Common: 9=SIGKILL, 15=SIGTERM, 2=SIGINT"},
+                    "fan_out": {"type": "boolean", "description": "With mode 'all', create one resource per address and apply them concurrently; delete every id in experiment_ids to stop it (default: false)"},
                 },
                 "required": ["namespace", "duration", "process"]
             }
@@ -562,6 +568,7 @@ def get_tools() -> list[Tool]:
                         "items": {"type": "string"},
                         "description": "Clock IDs to skew (default: ['CLOCK_REALTIME']). Options: CLOCK_REALTIME, CLOCK_MONOTONIC"
                     },
+                    "fan_out": {"type": "boolean", "description": "With mode 'all', create one resource per address and apply them concurrently; delete every id in experiment_ids to stop it (default: false)"},
                 },
                 "required": ["namespace", "duration", "time_offset"]
             }
@@ -769,7 +776,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         elif name == "check_chaos_type_requirements":
             result = await check_chaos_type_requirements(**arguments)
         elif name == "get_chaos_requirements":
-            result = await get_chaos_requirements(**arguments)
+            result = get_chaos_requirements(**arguments)
 
         # Management
         elif name == "get_experiment_status":
@@ -788,6 +795,9 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         else:
             raise ValueError(f"Unknown tool: {name}")
 
+        if isinstance(result, ChaosResult):
+            result = result.to_dict()
+
         import json
         return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
@@ -1,12 +1,60 @@
 """YAML template rendering for Chaos Mesh resources."""
 
-import uuid
+import os
+import threading
 import yaml
-from typing import Dict, Any, Optional
+from collections import deque
+from functools import partial
+from typing import Callable, Dict, Any, Optional
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
+
+def _dump_yaml(spec: Dict[str, Any]) -> str:
+    """Serialize a resource spec to block-style YAML, keeping key order.
+
+    Uses the libyaml C emitter when PyYAML was built with it. Specs only
+    hold plain dicts, lists, strings, numbers and booleans, so the safe
+    dumper produces the same output as yaml.dump.
+    """
+    return yaml.dump(spec, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+
+
+# apiVersion/kind header lines, rendered once per chaos kind
+_RESOURCE_HEADERS = {
+    kind: _dump_yaml({"apiVersion": "chaos-mesh.org/v1alpha1", "kind": kind})
+    for kind in (
+        "NetworkChaos", "StressChaos", "PodChaos", "IOChaos",
+        "HTTPChaos", "DNSChaos", "PhysicalMachineChaos"
+    )
+}
+
+
+def _dump_resource(kind: str, resource: Dict[str, Any]) -> str:
+    """Serialize a chaos resource, prefixing its precomputed header.
+
+    Only the per-call metadata and spec go through the YAML emitter.
+    """
+    return _RESOURCE_HEADERS[kind] + _dump_yaml(resource)
+
+
+# Random name suffixes (8 hex chars each), refilled from one urandom call
+_NAME_SUFFIX_BATCH = 256
+_name_suffixes: deque = deque()
+_name_suffixes_lock = threading.Lock()
+
+
+def _refill_name_suffixes() -> None:
+    """Draw a batch of random bytes and split it into name suffixes."""
+    entropy = os.urandom(4 * _NAME_SUFFIX_BATCH).hex()
+    _name_suffixes.extend(entropy[i:i + 8] for i in range(0, len(entropy), 8))
 
 
 def generate_name(prefix: str) -> str:
-    """Generate unique name with UUID suffix.
+    """Generate unique name with a random hex suffix.
 
     Args:
         prefix: Name prefix
@@ -14,7 +62,11 @@ def generate_name(prefix: str) -> str:
     Returns:
         Unique name
     """
-    return f"{prefix}-{uuid.uuid4().hex[:8]}"
+    with _name_suffixes_lock:
+        if not _name_suffixes:
+            _refill_name_suffixes()
+        suffix = _name_suffixes.popleft()
+    return f"{prefix}-{suffix}"
 
 
 def format_label_selectors(labels: Dict[str, str]) -> Dict[str, str]:
@@ -22,32 +74,22 @@ def format_label_selectors(labels: Dict[str, str]) -> Dict[str, str]:
     return labels
 
 
-def render_network_chaos(
+def _render_network(
+    action: str,
+    add_action_spec: Callable[[Dict[str, Any], Dict[str, Any]], None],
     name: str,
     namespace: str,
-    action: str,
     target_labels: Dict[str, str],
     duration: str,
     mode: str = "all",
     **action_params
 ) -> str:
-    """Render NetworkChaos YAML.
+    """Render NetworkChaos YAML for a single action.
 
-    Args:
-        name: Chaos experiment name
-        namespace: Target namespace
-        action: Chaos action (delay, loss, corrupt, partition, etc.)
-        target_labels: Target pod label selectors
-        duration: Experiment duration
-        mode: Selection mode
-        **action_params: Action-specific parameters
-
-    Returns:
-        Rendered YAML string
+    Not called directly: the per-action renderers below bind ``action``
+    and ``add_action_spec`` once at import time.
     """
     spec = {
-        "apiVersion": "chaos-mesh.org/v1alpha1",
-        "kind": "NetworkChaos",
         "metadata": {
             "name": name,
             "namespace": namespace
@@ -64,38 +106,108 @@ def render_network_chaos(
     }
 
     # Add action-specific parameters
-    if action == "delay":
-        spec["spec"]["delay"] = {
-            "latency": action_params.get("latency", "10ms"),
-            "jitter": action_params.get("jitter", "0ms"),
-            "correlation": action_params.get("correlation", "0")
-        }
-    elif action == "loss":
-        spec["spec"]["loss"] = {
-            "loss": action_params.get("loss", "50"),
-            "correlation": action_params.get("correlation", "0")
-        }
-    elif action == "corrupt":
-        spec["spec"]["corrupt"] = {
-            "corrupt": action_params.get("corrupt", "50"),
-            "correlation": action_params.get("correlation", "0")
-        }
-    elif action == "partition":
-        # Partition requires target or externalTargets
-        if "direction" in action_params:
-            spec["spec"]["direction"] = action_params["direction"]
-        if "target" in action_params:
-            spec["spec"]["target"] = action_params["target"]
-
-    # Optional direction parameter
-    if "direction" in action_params and action != "partition":
-        spec["spec"]["direction"] = action_params["direction"]
+    add_action_spec(spec["spec"], action_params)
 
     # Optional external targets
     if "external_targets" in action_params:
         spec["spec"]["externalTargets"] = action_params["external_targets"]
 
-    return yaml.dump(spec, default_flow_style=False, sort_keys=False)
+    return _dump_resource("NetworkChaos", spec)
+
+
+def _add_network_direction(spec: Dict[str, Any], action_params: Dict[str, Any]) -> None:
+    """Set the optional direction parameter."""
+    if "direction" in action_params:
+        spec["direction"] = action_params["direction"]
+
+
+def _add_network_delay(spec: Dict[str, Any], action_params: Dict[str, Any]) -> None:
+    """Add delay parameters."""
+    spec["delay"] = {
+        "latency": action_params.get("latency", "10ms"),
+        "jitter": action_params.get("jitter", "0ms"),
+        "correlation": action_params.get("correlation", "0")
+    }
+    _add_network_direction(spec, action_params)
+
+
+def _add_network_loss(spec: Dict[str, Any], action_params: Dict[str, Any]) -> None:
+    """Add packet loss parameters."""
+    spec["loss"] = {
+        "loss": action_params.get("loss", "50"),
+        "correlation": action_params.get("correlation", "0")
+    }
+    _add_network_direction(spec, action_params)
+
+
+def _add_network_corrupt(spec: Dict[str, Any], action_params: Dict[str, Any]) -> None:
+    """Add packet corruption parameters."""
+    spec["corrupt"] = {
+        "corrupt": action_params.get("corrupt", "50"),
+        "correlation": action_params.get("correlation", "0")
+    }
+    _add_network_direction(spec, action_params)
+
+
+def _add_network_partition(spec: Dict[str, Any], action_params: Dict[str, Any]) -> None:
+    """Add partition direction and target."""
+    # Partition requires target or externalTargets
+    _add_network_direction(spec, action_params)
+    if "target" in action_params:
+        spec["target"] = action_params["target"]
+
+
+# Per-action NetworkChaos renderers, specialized once at import time
+render_network_delay = partial(_render_network, "delay", _add_network_delay)
+render_network_loss = partial(_render_network, "loss", _add_network_loss)
+render_network_corrupt = partial(_render_network, "corrupt", _add_network_corrupt)
+render_network_partition = partial(_render_network, "partition", _add_network_partition)
+
+_NETWORK_ACTION_SPECS = {
+    "delay": _add_network_delay,
+    "loss": _add_network_loss,
+    "corrupt": _add_network_corrupt,
+    "partition": _add_network_partition,
+}
+
+
+def render_network_chaos(
+    name: str,
+    namespace: str,
+    action: str,
+    target_labels: Dict[str, str],
+    duration: str,
+    mode: str = "all",
+    **action_params
+) -> str:
+    """Render NetworkChaos YAML.
+
+    Prefer the per-action renderers (render_network_delay, ...) when the
+    action is known up front.
+
+    Args:
+        name: Chaos experiment name
+        namespace: Target namespace
+        action: Chaos action (delay, loss, corrupt, partition, etc.)
+        target_labels: Target pod label selectors
+        duration: Experiment duration
+        mode: Selection mode
+        **action_params: Action-specific parameters
+
+    Returns:
+        Rendered YAML string
+    """
+    add_action_spec = _NETWORK_ACTION_SPECS.get(action, _add_network_direction)
+    return _render_network(
+        action,
+        add_action_spec,
+        name=name,
+        namespace=namespace,
+        target_labels=target_labels,
+        duration=duration,
+        mode=mode,
+        **action_params
+    )
 
 
 def render_stress_chaos(
@@ -126,8 +238,6 @@ def render_stress_chaos(
         Rendered YAML string
     """
     spec = {
-        "apiVersion": "chaos-mesh.org/v1alpha1",
-        "kind": "StressChaos",
         "metadata": {
             "name": name,
             "namespace": namespace
@@ -157,7 +267,7 @@ def render_stress_chaos(
         if memory_size:
             spec["spec"]["stressors"]["memory"]["size"] = memory_size
 
-    return yaml.dump(spec, default_flow_style=False, sort_keys=False)
+    return _dump_resource("StressChaos", spec)
 
 
 def render_pod_chaos(
@@ -186,8 +296,6 @@ def render_pod_chaos(
         Rendered YAML string
     """
     spec = {
-        "apiVersion": "chaos-mesh.org/v1alpha1",
-        "kind": "PodChaos",
         "metadata": {
             "name": name,
             "namespace": namespace
@@ -211,7 +319,7 @@ def render_pod_chaos(
     if action == "pod-kill" and grace_period is not None:
         spec["spec"]["gracePeriod"] = grace_period
 
-    return yaml.dump(spec, default_flow_style=False, sort_keys=False)
+    return _dump_resource("PodChaos", spec)
 
 
 def render_io_chaos(
@@ -244,8 +352,6 @@ def render_io_chaos(
         Rendered YAML string
     """
     spec = {
-        "apiVersion": "chaos-mesh.org/v1alpha1",
-        "kind": "IOChaos",
         "metadata": {
             "name": name,
             "namespace": namespace
@@ -291,7 +397,7 @@ def render_io_chaos(
         if mistake_spec:
             spec["spec"]["mistake"] = mistake_spec
 
-    return yaml.dump(spec, default_flow_style=False, sort_keys=False)
+    return _dump_resource("IOChaos", spec)
 
 
 def render_http_chaos(
@@ -326,8 +432,6 @@ def render_http_chaos(
         Rendered YAML string
     """
     spec = {
-        "apiVersion": "chaos-mesh.org/v1alpha1",
-        "kind": "HTTPChaos",
         "metadata": {
             "name": name,
             "namespace": namespace
@@ -381,7 +485,7 @@ def render_http_chaos(
         if patch_spec:
             spec["spec"]["patch"] = patch_spec
 
-    return yaml.dump(spec, default_flow_style=False, sort_keys=False)
+    return _dump_resource("HTTPChaos", spec)
 
 
 def render_dns_chaos(
@@ -408,8 +512,6 @@ def render_dns_chaos(
         Rendered YAML string
     """
     spec = {
-        "apiVersion": "chaos-mesh.org/v1alpha1",
-        "kind": "DNSChaos",
         "metadata": {
             "name": name,
             "namespace": namespace
@@ -429,37 +531,26 @@ def render_dns_chaos(
     if patterns:
         spec["spec"]["patterns"] = patterns
 
-    return yaml.dump(spec, default_flow_style=False, sort_keys=False)
+    return _dump_resource("DNSChaos", spec)
 
 
-def render_physical_chaos(
+def _render_physical(
+    action: str,
+    add_action_spec: Callable[[Dict[str, Any], Dict[str, Any]], None],
     name: str,
     namespace: str,
-    action: str,
     duration: str,
     mode: str = "one",
     address: Optional[list] = None,
     selector: Optional[Dict[str, str]] = None,
     **action_params
 ) -> str:
-    """Render PhysicalMachineChaos YAML.
-
-    Args:
-        name: Chaos experiment name
-        namespace: Target namespace
-        action: Chaos action (stress-cpu, stress-mem, disk-fill, process-kill, clock-skew)
-        duration: Experiment duration
-        mode: Selection mode
-        address: List of target machine addresses (mutually exclusive with selector)
-        selector: Label selectors for target machines (mutually exclusive with address)
-        **action_params: Action-specific parameters
+    """Render PhysicalMachineChaos YAML for a single action.
 
-    Returns:
-        Rendered YAML string
+    Not called directly: the per-action renderers below bind ``action``
+    and ``add_action_spec`` once at import time.
     """
     spec = {
-        "apiVersion": "chaos-mesh.org/v1alpha1",
-        "kind": "PhysicalMachineChaos",
         "metadata": {
             "name": name,
             "namespace": namespace
@@ -480,42 +571,116 @@ def render_physical_chaos(
         }
 
     # Add action-specific parameters
-    if action == "stress-cpu":
-        stress_cpu = {"workers": action_params.get("workers", 1)}
-        if "load" in action_params:
-            stress_cpu["load"] = action_params["load"]
-        spec["spec"]["stress-cpu"] = stress_cpu
-
-    elif action == "stress-mem":
-        stress_mem = {}
-        if "size" in action_params:
-            stress_mem["size"] = action_params["size"]
-        spec["spec"]["stress-mem"] = stress_mem
-
-    elif action == "disk-fill":
-        spec["spec"]["disk-fill"] = {
-            "path": action_params["path"],
-            "size": action_params["size"],
-            "fill-by-fallocate": action_params.get("fill_by_fallocate", True)
-        }
+    add_action_spec(spec["spec"], action_params)
 
-    elif action == "process":
-        spec["spec"]["process"] = {
-            "process": action_params["process"],
-            "signal": action_params.get("signal", 9)
-        }
+    return _dump_resource("PhysicalMachineChaos", spec)
 
-    elif action == "clock":
-        clock_spec = {
-            "time-offset": action_params["time_offset"],
-            "pid": action_params["pid"]
-        }
-        if "clock_ids" in action_params:
-            # Convert list to comma-separated string
-            clock_spec["clock-ids-slice"] = ",".join(action_params["clock_ids"])
-        spec["spec"]["clock"] = clock_spec
 
-    return yaml.dump(spec, default_flow_style=False, sort_keys=False)
+def _add_physical_stress_cpu(spec: Dict[str, Any], action_params: Dict[str, Any]) -> None:
+    """Add CPU stressor parameters."""
+    stress_cpu = {"workers": action_params.get("workers", 1)}
+    if "load" in action_params:
+        stress_cpu["load"] = action_params["load"]
+    spec["stress-cpu"] = stress_cpu
+
+
+def _add_physical_stress_mem(spec: Dict[str, Any], action_params: Dict[str, Any]) -> None:
+    """Add memory stressor parameters."""
+    stress_mem = {}
+    if "size" in action_params:
+        stress_mem["size"] = action_params["size"]
+    spec["stress-mem"] = stress_mem
+
+
+def _add_physical_disk_fill(spec: Dict[str, Any], action_params: Dict[str, Any]) -> None:
+    """Add disk fill parameters."""
+    spec["disk-fill"] = {
+        "path": action_params["path"],
+        "size": action_params["size"],
+        "fill-by-fallocate": action_params.get("fill_by_fallocate", True)
+    }
+
+
+def _add_physical_process(spec: Dict[str, Any], action_params: Dict[str, Any]) -> None:
+    """Add process kill parameters."""
+    spec["process"] = {
+        "process": action_params["process"],
+        "signal": action_params.get("signal", 9)
+    }
+
+
+def _add_physical_clock(spec: Dict[str, Any], action_params: Dict[str, Any]) -> None:
+    """Add clock skew parameters."""
+    clock_spec = {
+        "time-offset": action_params["time_offset"],
+        "pid": action_params["pid"]
+    }
+    if "clock_ids" in action_params:
+        # Convert list to comma-separated string
+        clock_spec["clock-ids-slice"] = ",".join(action_params["clock_ids"])
+    spec["clock"] = clock_spec
+
+
+def _add_nothing(spec: Dict[str, Any], action_params: Dict[str, Any]) -> None:
+    """Action without extra parameters."""
+
+
+# Per-action PhysicalMachineChaos renderers, specialized once at import time
+render_physical_stress_cpu = partial(_render_physical, "stress-cpu", _add_physical_stress_cpu)
+render_physical_stress_mem = partial(_render_physical, "stress-mem", _add_physical_stress_mem)
+render_physical_disk_fill = partial(_render_physical, "disk-fill", _add_physical_disk_fill)
+render_physical_process = partial(_render_physical, "process", _add_physical_process)
+render_physical_clock = partial(_render_physical, "clock", _add_physical_clock)
+
+_PHYSICAL_ACTION_SPECS = {
+    "stress-cpu": _add_physical_stress_cpu,
+    "stress-mem": _add_physical_stress_mem,
+    "disk-fill": _add_physical_disk_fill,
+    "process": _add_physical_process,
+    "clock": _add_physical_clock,
+}
+
+
+def render_physical_chaos(
+    name: str,
+    namespace: str,
+    action: str,
+    duration: str,
+    mode: str = "one",
+    address: Optional[list] = None,
+    selector: Optional[Dict[str, str]] = None,
+    **action_params
+) -> str:
+    """Render PhysicalMachineChaos YAML.
+
+    Prefer the per-action renderers (render_physical_stress_cpu, ...) when
+    the action is known up front.
+
+    Args:
+        name: Chaos experiment name
+        namespace: Target namespace
+        action: Chaos action (stress-cpu, stress-mem, disk-fill, process, clock)
+        duration: Experiment duration
+        mode: Selection mode
+        address: List of target machine addresses (mutually exclusive with selector)
+        selector: Label selectors for target machines (mutually exclusive with address)
+        **action_params: Action-specific parameters
+
+    Returns:
+        Rendered YAML string
+    """
+    add_action_spec = _PHYSICAL_ACTION_SPECS.get(action, _add_nothing)
+    return _render_physical(
+        action,
+        add_action_spec,
+        name=name,
+        namespace=namespace,
+        duration=duration,
+        mode=mode,
+        address=address,
+        selector=selector,
+        **action_params
+    )
 
 
 def interpret_chaos_status(chaos_obj: Dict[str, Any]) -> Dict[str, Any]:
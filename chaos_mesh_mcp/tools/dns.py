@@ -1,12 +1,13 @@
 """DNSChaos tools for MCP."""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Optional, List
 from ..validators import (
     validate_duration,
     validate_mode,
     validate_labels
 )
 from ..templates import generate_name, render_dns_chaos
+from ..models import ChaosResult
 from ..kubectl import apply_yaml, check_target_exists
 
 
@@ -16,7 +17,7 @@ async def create_dns_error(
     duration: str,
     patterns: Optional[List[str]] = None,
     mode: str = "all"
-) -> Dict[str, Any]:
+) -> ChaosResult:
     """Create DNSChaos with error action.
 
     Returns DNS errors for specified domain patterns.
@@ -34,16 +35,18 @@ async def create_dns_error(
         Experiment details with experiment_id and affected_pods
 
     Example:
-        >>> await create_dns_error(
+        >>> result = await create_dns_error(
         ...     namespace="default",
         ...     target_labels={"app": "web-server"},
         ...     duration="60s",
         ...     patterns=["google.com", "*.example.com"]
         ... )
+        >>> result.to_dict()
         {
             "experiment_id": "dns-error-a3f4b2c1",
             "kind": "DNSChaos",
             "action": "error",
+            "namespace": "default",
             "affected_pods": ["web-server-0"],
             "parameters": {"patterns": ["google.com", "*.example.com"]}
         }
@@ -72,7 +75,7 @@ async def create_dns_error(
 
     # Check if target pods exist
     target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if not target_check.exists:
         raise ValueError(
             f"No pods found with labels {target_labels} in namespace '{namespace}'. "
             f"Please verify the label selectors."
@@ -95,18 +98,18 @@ async def create_dns_error(
     # Apply
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "DNSChaos",
-        "action": "error",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="DNSChaos",
+        action="error",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "patterns": patterns if patterns else "all domains",
             "mode": mode
         },
-        "duration": duration
-    }
+        duration=duration
+    )
 
 
 async def create_dns_random(
@@ -115,7 +118,7 @@ async def create_dns_random(
     duration: str,
     patterns: Optional[List[str]] = None,
     mode: str = "all"
-) -> Dict[str, Any]:
+) -> ChaosResult:
     """Create DNSChaos with random action.
 
     Returns random IP addresses for DNS queries.
@@ -164,7 +167,7 @@ async def create_dns_random(
 
     # Check target
     target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Generate and apply
@@ -181,15 +184,15 @@ async def create_dns_random(
 
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "DNSChaos",
-        "action": "random",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="DNSChaos",
+        action="random",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "patterns": patterns if patterns else "all domains",
             "mode": mode
         },
-        "duration": duration
-    }
+        duration=duration
+    )
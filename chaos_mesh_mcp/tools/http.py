@@ -1,6 +1,6 @@
 """HTTPChaos tools for MCP."""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Optional, List
 import base64
 from ..validators import (
     validate_duration,
@@ -8,6 +8,7 @@ from ..validators import (
     validate_labels
 )
 from ..templates import generate_name, render_http_chaos
+from ..models import ChaosResult
 from ..kubectl import apply_yaml, check_target_exists
 
 
@@ -21,7 +22,7 @@ async def create_http_abort(
     path: Optional[str] = None,
     mode: str = "all",
     request_headers: Optional[Dict[str, str]] = None
-) -> Dict[str, Any]:
+) -> ChaosResult:
     """Create HTTPChaos with abort action.
 
     Interrupts HTTP connections to simulate network failures.
@@ -41,7 +42,7 @@ async def create_http_abort(
         Experiment details with experiment_id and affected_pods
 
     Example:
-        >>> await create_http_abort(
+        >>> result = await create_http_abort(
         ...     namespace="default",
         ...     target_labels={"app": "nginx"},
         ...     port=80,
@@ -49,10 +50,12 @@ async def create_http_abort(
         ...     method="GET",
         ...     path="/api/*"
         ... )
+        >>> result.to_dict()
         {
             "experiment_id": "http-abort-a3f4b2c1",
             "kind": "HTTPChaos",
             "action": "abort",
+            "namespace": "default",
             "affected_pods": ["nginx-0"],
             "parameters": {"port": 80, "method": "GET", "path": "/api/*"}
         }
@@ -73,7 +76,7 @@ async def create_http_abort(
 
     # Check if target pods exist
     target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if not target_check.exists:
         raise ValueError(
             f"No pods found with labels {target_labels} in namespace '{namespace}'. "
             f"Please verify the label selectors."
@@ -100,21 +103,21 @@ async def create_http_abort(
     # Apply
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "HTTPChaos",
-        "action": "abort",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="HTTPChaos",
+        action="abort",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "port": port,
             "target": target,
             "method": method or "all",
             "path": path or "all",
             "request_headers": request_headers
         },
-        "duration": duration
-    }
+        duration=duration
+    )
 
 
 async def create_http_delay(
@@ -128,7 +131,7 @@ async def create_http_delay(
     path: Optional[str] = None,
     mode: str = "all",
     request_headers: Optional[Dict[str, str]] = None
-) -> Dict[str, Any]:
+) -> ChaosResult:
     """Create HTTPChaos with delay action.
 
     Injects latency into HTTP requests or responses.
@@ -176,7 +179,7 @@ async def create_http_delay(
 
     # Check target
     target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Generate and apply
@@ -197,13 +200,13 @@ async def create_http_delay(
 
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "HTTPChaos",
-        "action": "delay",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="HTTPChaos",
+        action="delay",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "port": port,
             "target": target,
             "delay": delay,
@@ -211,8 +214,8 @@ async def create_http_delay(
             "path": path or "all",
             "request_headers": request_headers
         },
-        "duration": duration
-    }
+        duration=duration
+    )
 
 
 async def create_http_replace(
@@ -227,7 +230,7 @@ async def create_http_replace(
     replace_body: Optional[str] = None,
     mode: str = "all",
     request_headers: Optional[Dict[str, str]] = None
-) -> Dict[str, Any]:
+) -> ChaosResult:
     """Create HTTPChaos with replace action.
 
     Replaces content in HTTP request or response messages.
@@ -281,7 +284,7 @@ async def create_http_replace(
 
     # Check target
     target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Base64 encode body if provided
@@ -308,13 +311,13 @@ async def create_http_replace(
 
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "HTTPChaos",
-        "action": "replace",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="HTTPChaos",
+        action="replace",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "port": port,
             "target": target,
             "method": method or "all",
@@ -323,8 +326,8 @@ async def create_http_replace(
             "replace_body": replace_body if replace_body else None,
             "request_headers": request_headers
         },
-        "duration": duration
-    }
+        duration=duration
+    )
 
 
 async def create_http_patch(
@@ -339,7 +342,7 @@ async def create_http_patch(
     patch_body_value: Optional[str] = None,
     mode: str = "all",
     request_headers: Optional[Dict[str, str]] = None
-) -> Dict[str, Any]:
+) -> ChaosResult:
     """Create HTTPChaos with patch action.
 
     Adds additional content to HTTP request or response messages.
@@ -398,7 +401,7 @@ async def create_http_patch(
 
     # Check target
     target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Generate and apply
@@ -420,13 +423,13 @@ async def create_http_patch(
 
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "HTTPChaos",
-        "action": "patch",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="HTTPChaos",
+        action="patch",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "port": port,
             "target": target,
             "method": method or "all",
@@ -435,5 +438,5 @@ async def create_http_patch(
             "patch_body_value": patch_body_value,
             "request_headers": request_headers
         },
-        "duration": duration
-    }
+        duration=duration
+    )
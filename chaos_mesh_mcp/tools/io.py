@@ -1,6 +1,6 @@
 """IOChaos tools for MCP."""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Optional, List
 from ..validators import (
     validate_duration,
     validate_percentage,
@@ -8,6 +8,7 @@ from ..validators import (
     validate_labels
 )
 from ..templates import generate_name, render_io_chaos
+from ..models import ChaosResult
 from ..kubectl import apply_yaml, check_target_exists
 
 
@@ -21,7 +22,7 @@ async def create_io_latency(
     percent: int = 100,
     mode: str = "all",
     methods: Optional[List[str]] = None
-) -> Dict[str, Any]:
+) -> ChaosResult:
     """Create IOChaos with latency action.
 
     Delays file system calls to simulate slow disk I/O.
@@ -41,7 +42,7 @@ async def create_io_latency(
         Experiment details with experiment_id and affected_pods
 
     Example:
-        >>> await create_io_latency(
+        >>> result = await create_io_latency(
         ...     namespace="default",
         ...     target_labels={"app": "mysql"},
         ...     volume_path="/var/lib/mysql",
@@ -50,10 +51,12 @@ async def create_io_latency(
         ...     duration="120s",
         ...     methods=["read", "write"]
         ... )
+        >>> result.to_dict()
         {
             "experiment_id": "io-latency-a3f4b2c1",
             "kind": "IOChaos",
             "action": "latency",
+            "namespace": "default",
             "affected_pods": ["mysql-0"],
             "parameters": {"delay": "100ms", "percent": 100}
         }
@@ -73,7 +76,7 @@ async def create_io_latency(
 
     # Check if target pods exist
     target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if not target_check.exists:
         raise ValueError(
             f"No pods found with labels {target_labels} in namespace '{namespace}'. "
             f"Please verify the label selectors."
@@ -100,21 +103,21 @@ async def create_io_latency(
     # Apply
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "IOChaos",
-        "action": "latency",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="IOChaos",
+        action="latency",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "volume_path": volume_path,
             "path": path,
             "delay": delay,
             "percent": percent,
             "methods": methods or "all"
         },
-        "duration": duration
-    }
+        duration=duration
+    )
 
 
 async def create_io_fault(
@@ -127,7 +130,7 @@ async def create_io_fault(
     percent: int = 100,
     mode: str = "all",
     methods: Optional[List[str]] = None
-) -> Dict[str, Any]:
+) -> ChaosResult:
     """Create IOChaos with fault action.
 
     Returns errors for file system calls to simulate I/O failures.
@@ -181,7 +184,7 @@ async def create_io_fault(
 
     # Check target
     target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Generate and apply
@@ -202,21 +205,21 @@ async def create_io_fault(
 
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "IOChaos",
-        "action": "fault",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="IOChaos",
+        action="fault",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "volume_path": volume_path,
             "path": path,
             "errno": errno,
             "percent": percent,
             "methods": methods or "all"
         },
-        "duration": duration
-    }
+        duration=duration
+    )
 
 
 async def create_io_attr_override(
@@ -230,7 +233,7 @@ async def create_io_attr_override(
     percent: int = 100,
     mode: str = "all",
     methods: Optional[List[str]] = None
-) -> Dict[str, Any]:
+) -> ChaosResult:
     """Create IOChaos with attrOverride action.
 
     Modifies file properties like permissions and size.
@@ -284,7 +287,7 @@ async def create_io_attr_override(
 
     # Check target
     target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Build attr dict
@@ -312,21 +315,21 @@ async def create_io_attr_override(
 
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "IOChaos",
-        "action": "attrOverride",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="IOChaos",
+        action="attrOverride",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "volume_path": volume_path,
             "path": path,
             "attr": attr,
             "percent": percent,
             "methods": methods or "all"
         },
-        "duration": duration
-    }
+        duration=duration
+    )
 
 
 async def create_io_mistake(
@@ -341,7 +344,7 @@ async def create_io_mistake(
     percent: int = 100,
     mode: str = "all",
     methods: Optional[List[str]] = None
-) -> Dict[str, Any]:
+) -> ChaosResult:
     """Create IOChaos with mistake action.
 
     Makes files read or write wrong values (data corruption).
@@ -398,7 +401,7 @@ async def create_io_mistake(
 
     # Check target
     target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Generate and apply
@@ -421,13 +424,13 @@ async def create_io_mistake(
 
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "IOChaos",
-        "action": "mistake",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="IOChaos",
+        action="mistake",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "volume_path": volume_path,
             "path": path,
             "filling": filling,
@@ -436,5 +439,5 @@ async def create_io_mistake(
             "percent": percent,
             "methods": methods or "all"
         },
-        "duration": duration
-    }
+        duration=duration
+    )
@@ -1,16 +1,25 @@
 """NetworkChaos tools for MCP."""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Optional, List
 from ..validators import (
     validate_duration,
+    validate_durations,
     validate_percentage,
+    validate_percentages,
     validate_direction,
     validate_bandwidth,
     validate_mode,
     validate_labels
 )
-from ..templates import generate_name, render_network_chaos
-from ..kubectl import apply_yaml, check_target_exists
+from ..templates import (
+    generate_name,
+    render_network_delay,
+    render_network_loss,
+    render_network_partition,
+    render_network_corrupt
+)
+from ..models import ChaosResult
+from ..kubectl import apply_yaml, assume_target_exists, check_target_exists
 
 
 async def create_network_delay(
@@ -22,8 +31,10 @@ async def create_network_delay(
     correlation: str = "0",
     mode: str = "all",
     direction: str = "to",
-    external_targets: Optional[List[str]] = None
-) -> Dict[str, Any]:
+    external_targets: Optional[List[str]] = None,
+    skip_target_check: bool = False,
+    pre_validated: bool = False
+) -> ChaosResult:
     """Create NetworkChaos with delay action.
 
     Injects network latency to target pods.
@@ -38,38 +49,46 @@ async def create_network_delay(
         mode: Selection mode (one/all/fixed/fixed-percent). Default: "all"
         direction: Traffic direction (to/from/both). Default: "to"
         external_targets: Optional external IPs/domains (e.g., ["1.1.1.1", "google.com"])
+        skip_target_check: Skip the target pod lookup when the pods are known to exist.
+              affected_pods is then empty. Default: False
+        pre_validated: Skip parameter validation for inputs already checked
+              upstream (e.g. by a planner's schema). Default: False
 
     Returns:
         Experiment details with experiment_id and affected_pods
 
     Example:
-        >>> await create_network_delay(
+        >>> result = await create_network_delay(
         ...     namespace="default",
         ...     target_labels={"app": "mongodb"},
         ...     latency="800ms",
         ...     jitter="100ms",
         ...     duration="120s"
         ... )
+        >>> result.to_dict()
         {
             "experiment_id": "network-delay-a3f4b2c1",
             "kind": "NetworkChaos",
             "action": "delay",
+            "namespace": "default",
             "affected_pods": ["mongodb-0"],
             "parameters": {"latency": "800ms", "jitter": "100ms"}
         }
     """
     # Validate parameters
-    validate_labels(target_labels)
-    validate_duration(latency)
-    validate_duration(duration)
-    validate_duration(jitter)
-    validate_percentage(correlation)
-    validate_mode(mode)
-    validate_direction(direction)
+    if not pre_validated:
+        validate_labels(target_labels)
+        validate_durations(latency, duration, jitter)
+        validate_percentage(correlation)
+        validate_mode(mode)
+        validate_direction(direction)
 
     # Check if target pods exist
-    target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if skip_target_check:
+        target_check = assume_target_exists()
+    else:
+        target_check = check_target_exists(namespace, target_labels)
+    if not target_check.exists:
         raise ValueError(
             f"No pods found with labels {target_labels} in namespace '{namespace}'. "
             f"Please verify the label selectors."
@@ -79,10 +98,9 @@ async def create_network_delay(
     name = generate_name("network-delay")
 
     # Render YAML
-    yaml_content = render_network_chaos(
+    yaml_content = render_network_delay(
         name=name,
         namespace=namespace,
-        action="delay",
         target_labels=target_labels,
         duration=duration,
         mode=mode,
@@ -96,20 +114,20 @@ async def create_network_delay(
     # Apply
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "NetworkChaos",
-        "action": "delay",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="NetworkChaos",
+        action="delay",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "latency": latency,
             "jitter": jitter,
             "correlation": correlation,
             "direction": direction
         },
-        "duration": duration
-    }
+        duration=duration
+    )
 
 
 async def create_network_loss(
@@ -119,8 +137,10 @@ async def create_network_loss(
     duration: str,
     correlation: str = "0",
     mode: str = "all",
-    direction: str = "to"
-) -> Dict[str, Any]:
+    direction: str = "to",
+    skip_target_check: bool = False,
+    pre_validated: bool = False
+) -> ChaosResult:
     """Create NetworkChaos with packet loss action.
 
     Drops network packets to simulate packet loss.
@@ -133,6 +153,10 @@ async def create_network_loss(
         correlation: Correlation to previous loss [0-100]. Default: "0"
         mode: Selection mode. Default: "all"
         direction: Traffic direction. Default: "to"
+        skip_target_check: Skip the target pod lookup when the pods are known to exist.
+              affected_pods is then empty. Default: False
+        pre_validated: Skip parameter validation for inputs already checked
+              upstream (e.g. by a planner's schema). Default: False
 
     Returns:
         Experiment details
@@ -146,24 +170,26 @@ async def create_network_loss(
         ... )
     """
     # Validate
-    validate_labels(target_labels)
-    validate_percentage(loss)
-    validate_duration(duration)
-    validate_percentage(correlation)
-    validate_mode(mode)
-    validate_direction(direction)
+    if not pre_validated:
+        validate_labels(target_labels)
+        validate_percentages(loss, correlation)
+        validate_duration(duration)
+        validate_mode(mode)
+        validate_direction(direction)
 
     # Check target
-    target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if skip_target_check:
+        target_check = assume_target_exists()
+    else:
+        target_check = check_target_exists(namespace, target_labels)
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Generate and apply
     name = generate_name("network-loss")
-    yaml_content = render_network_chaos(
+    yaml_content = render_network_loss(
         name=name,
         namespace=namespace,
-        action="loss",
         target_labels=target_labels,
         duration=duration,
         mode=mode,
@@ -174,19 +200,19 @@ async def create_network_loss(
 
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "NetworkChaos",
-        "action": "loss",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="NetworkChaos",
+        action="loss",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "loss": loss + "%",
             "correlation": correlation,
             "direction": direction
         },
-        "duration": duration
-    }
+        duration=duration
+    )
 
 
 async def create_network_partition(
@@ -195,8 +221,10 @@ async def create_network_partition(
     duration: str,
     direction: str = "both",
     mode: str = "all",
-    external_targets: Optional[List[str]] = None
-) -> Dict[str, Any]:
+    external_targets: Optional[List[str]] = None,
+    skip_target_check: bool = False,
+    pre_validated: bool = False
+) -> ChaosResult:
     """Create NetworkChaos with partition action.
 
     Simulates network partition (network split).
@@ -208,6 +236,10 @@ async def create_network_partition(
         direction: Partition direction (to/from/both). Default: "both"
         mode: Selection mode. Default: "all"
         external_targets: Optional external targets to partition from
+        skip_target_check: Skip the target pod lookup when the pods are known to exist.
+              affected_pods is then empty. Default: False
+        pre_validated: Skip parameter validation for inputs already checked
+              upstream (e.g. by a planner's schema). Default: False
 
     Returns:
         Experiment details
@@ -221,22 +253,25 @@ async def create_network_partition(
         ... )
     """
     # Validate
-    validate_labels(target_labels)
-    validate_duration(duration)
-    validate_direction(direction)
-    validate_mode(mode)
+    if not pre_validated:
+        validate_labels(target_labels)
+        validate_duration(duration)
+        validate_direction(direction)
+        validate_mode(mode)
 
     # Check target
-    target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if skip_target_check:
+        target_check = assume_target_exists()
+    else:
+        target_check = check_target_exists(namespace, target_labels)
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Generate and apply
     name = generate_name("network-partition")
-    yaml_content = render_network_chaos(
+    yaml_content = render_network_partition(
         name=name,
         namespace=namespace,
-        action="partition",
         target_labels=target_labels,
         duration=duration,
         mode=mode,
@@ -246,17 +281,17 @@ async def create_network_partition(
 
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "NetworkChaos",
-        "action": "partition",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="NetworkChaos",
+        action="partition",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "direction": direction
         },
-        "duration": duration
-    }
+        duration=duration
+    )
 
 
 async def create_network_corrupt(
@@ -266,8 +301,10 @@ async def create_network_corrupt(
     duration: str,
     correlation: str = "0",
     mode: str = "all",
-    direction: str = "to"
-) -> Dict[str, Any]:
+    direction: str = "to",
+    skip_target_check: bool = False,
+    pre_validated: bool = False
+) -> ChaosResult:
     """Create NetworkChaos with corrupt action.
 
     Corrupts network packets.
@@ -280,29 +317,35 @@ async def create_network_corrupt(
         correlation: Correlation to previous corruption [0-100]. Default: "0"
         mode: Selection mode. Default: "all"
         direction: Traffic direction. Default: "to"
+        skip_target_check: Skip the target pod lookup when the pods are known to exist.
+              affected_pods is then empty. Default: False
+        pre_validated: Skip parameter validation for inputs already checked
+              upstream (e.g. by a planner's schema). Default: False
 
     Returns:
         Experiment details
     """
     # Validate
-    validate_labels(target_labels)
-    validate_percentage(corrupt)
-    validate_duration(duration)
-    validate_percentage(correlation)
-    validate_mode(mode)
-    validate_direction(direction)
+    if not pre_validated:
+        validate_labels(target_labels)
+        validate_percentages(corrupt, correlation)
+        validate_duration(duration)
+        validate_mode(mode)
+        validate_direction(direction)
 
     # Check target
-    target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    if skip_target_check:
+        target_check = assume_target_exists()
+    else:
+        target_check = check_target_exists(namespace, target_labels)
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Generate and apply
     name = generate_name("network-corrupt")
-    yaml_content = render_network_chaos(
+    yaml_content = render_network_corrupt(
         name=name,
         namespace=namespace,
-        action="corrupt",
         target_labels=target_labels,
         duration=duration,
         mode=mode,
@@ -313,16 +356,16 @@ async def create_network_corrupt(
 
     apply_yaml(yaml_content)
 
-    return {
-        "experiment_id": name,
-        "kind": "NetworkChaos",
-        "action": "corrupt",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="NetworkChaos",
+        action="corrupt",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "corrupt": corrupt + "%",
             "correlation": correlation,
             "direction": direction
         },
-        "duration": duration
-    }
+        duration=duration
+    )
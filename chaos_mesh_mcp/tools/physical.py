@@ -6,10 +6,99 @@ Supports two targeting modes (mutually exclusive):
 - selector: Label-based selection via Chaos Mesh Chaosd discovery
 """
 
-import uuid
-from typing import Dict, Any, List, Optional
+import asyncio
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
+from ..models import ChaosResult
 from ..kubectl import KubectlRunner
-from ..templates import render_physical_chaos
+from ..templates import (
+    generate_name,
+    render_physical_stress_cpu,
+    render_physical_stress_mem,
+    render_physical_disk_fill,
+    render_physical_process,
+    render_physical_clock
+)
+
+
+_ERR_BOTH_TARGETS = "Cannot specify both 'address' and 'selector'. Choose one targeting mode."
+_ERR_NO_TARGETS = "Must specify either 'address' or 'selector' for targeting."
+
+# Upper bound on concurrent kubectl applies when fanning out over addresses
+_MAX_CONCURRENT_APPLIES = 16
+
+
+def _validate_targeting(address: Optional[List[str]], selector: Optional[Dict[str, str]]) -> None:
+    """Ensure exactly one of address or selector is given.
+
+    Raises:
+        ValueError: If both or neither are specified
+    """
+    if address and selector:
+        raise ValueError(_ERR_BOTH_TARGETS)
+    if not address and not selector:
+        raise ValueError(_ERR_NO_TARGETS)
+
+
+async def _apply_physical(
+    render: Callable[..., str],
+    name: str,
+    namespace: str,
+    mode: str,
+    address: Optional[List[str]],
+    fan_out: bool = False,
+    **render_params
+) -> Tuple[List[str], Union[Dict[str, Any], List[Dict[str, Any]]]]:
+    """Render and apply PhysicalMachineChaos.
+
+    With fan_out, mode "all" and several addresses, one resource per
+    address is created and applied concurrently. That is equivalent to a
+    single resource covering every address, but the round-trips overlap.
+    Other modes pick a subset of the addresses, so they keep a single
+    resource. If any per-address apply fails, the resources that were
+    created are deleted again before the error is raised.
+
+    Args:
+        render: Per-action renderer from templates
+        name: Chaos experiment name (suffixed per address when fanning out)
+        namespace: Namespace to create the chaos resource
+        mode: Selection mode
+        address: List of target machine addresses
+        fan_out: Create one resource per address. Default: False
+        **render_params: Remaining renderer arguments
+
+    Returns:
+        Tuple of created resource names and the apply result
+        (a list of results when fanned out)
+    """
+    kubectl = KubectlRunner()
+
+    if not fan_out or mode != "all" or not address or len(address) < 2:
+        yaml_content = render(name=name, namespace=namespace, mode=mode, address=address, **render_params)
+        return [name], await kubectl.apply_yaml(yaml_content, namespace)
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_APPLIES)
+    names = [f"{name}-{i}" for i in range(len(address))]
+
+    async def apply_one(resource_name: str, target: str) -> Dict[str, Any]:
+        yaml_content = render(name=resource_name, namespace=namespace, mode=mode, address=[target], **render_params)
+        async with semaphore:
+            return await kubectl.apply_yaml(yaml_content, namespace)
+
+    results = await asyncio.gather(
+        *(apply_one(n, a) for n, a in zip(names, address)),
+        return_exceptions=True
+    )
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        # Do not leave chaos running on the machines whose apply succeeded
+        created = [n for n, r in zip(names, results) if not isinstance(r, BaseException)]
+        await asyncio.gather(
+            *(kubectl.run_command(f"delete physicalmachinechaos {n} -n {namespace} --ignore-not-found")
+              for n in created),
+            return_exceptions=True
+        )
+        raise errors[0]
+    return names, results
 
 
 async def create_physical_stress_cpu(
@@ -19,8 +108,9 @@ async def create_physical_stress_cpu(
     selector: Optional[Dict[str, str]] = None,
     mode: str = "one",
     workers: int = 1,
-    load: Optional[int] = None
-) -> Dict[str, Any]:
+    load: Optional[int] = None,
+    fan_out: bool = False
+) -> ChaosResult:
     """Create PhysicalMachineChaos to stress CPU on physical/virtual machines.
 
     Injects CPU stress on target machines using stress-ng.
@@ -33,6 +123,8 @@ async def create_physical_stress_cpu(
         mode: Selection mode ("one", "all", "fixed", "fixed-percent", "random-max-percent")
         workers: Number of CPU stress workers (default: 1)
         load: CPU load percentage per worker (0-100, optional)
+        fan_out: With mode "all", create one resource per address and apply
+              them concurrently (default: False)
 
     Returns:
         Chaos experiment details
@@ -40,6 +132,9 @@ async def create_physical_stress_cpu(
     Note:
         - Requires Chaosd agent running on target machines
         - Must specify EITHER address OR selector, not both
+        - With fan_out, mode "all" and several addresses, one resource is
+          created per address and applied concurrently; experiment_ids lists
+          them all, and each must be deleted to stop the chaos
         - Load parameter sets CPU load %, without it uses 100%
 
     Raises:
@@ -55,12 +150,9 @@ async def create_physical_stress_cpu(
         )
     """
     # Validate targeting parameters
-    if address and selector:
-        raise ValueError("Cannot specify both 'address' and 'selector'. Choose one targeting mode.")
-    if not address and not selector:
-        raise ValueError("Must specify either 'address' or 'selector' for targeting.")
+    _validate_targeting(address, selector)
 
-    name = f"physical-cpu-stress-{uuid.uuid4().hex[:8]}"
+    name = generate_name("physical-cpu-stress")
 
     action_params = {
         "workers": workers
@@ -70,35 +162,34 @@ async def create_physical_stress_cpu(
             raise ValueError(f"CPU load must be between 0-100, got {load}")
         action_params["load"] = load
 
-    yaml_content = render_physical_chaos(
+    names, result = await _apply_physical(
+        render_physical_stress_cpu,
         name=name,
         namespace=namespace,
-        action="stress-cpu",
         duration=duration,
         mode=mode,
         address=address,
+        fan_out=fan_out,
         selector=selector,
         **action_params
     )
 
-    kubectl = KubectlRunner()
-    result = await kubectl.apply_yaml(yaml_content, namespace)
-
-    return {
-        "experiment_id": name,
-        "kind": "PhysicalMachineChaos",
-        "action": "stress-cpu",
-        "namespace": namespace,
-        "target_mode": "address" if address else "selector",
-        "targets": address if address else selector,
-        "parameters": {
+    return ChaosResult(
+        experiment_id=names[0],
+        experiment_ids=names,
+        kind="PhysicalMachineChaos",
+        action="stress-cpu",
+        namespace=namespace,
+        target_mode="address" if address else "selector",
+        targets=address if address else selector,
+        parameters={
             "duration": duration,
             "mode": mode,
             "workers": workers,
             "load": load
         },
-        "status": result
-    }
+        status=result
+    )
 
 
 async def create_physical_stress_memory(
@@ -107,8 +198,9 @@ async def create_physical_stress_memory(
     address: Optional[List[str]] = None,
     selector: Optional[Dict[str, str]] = None,
     mode: str = "one",
-    size: Optional[str] = None
-) -> Dict[str, Any]:
+    size: Optional[str] = None,
+    fan_out: bool = False
+) -> ChaosResult:
     """Create PhysicalMachineChaos to stress memory on physical/virtual machines.
 
     Injects memory stress on target machines using stress-ng.
@@ -120,6 +212,8 @@ async def create_physical_stress_memory(
         selector: Label selectors for target machines
         mode: Selection mode ("one", "all", "fixed", "fixed-percent", "random-max-percent")
         size: Memory size to allocate (e.g., "256MB", "1GB"). If not specified, allocates all available memory.
+        fan_out: With mode "all", create one resource per address and apply
+              them concurrently (default: False)
 
     Returns:
         Chaos experiment details
@@ -127,6 +221,9 @@ async def create_physical_stress_memory(
     Note:
         - Requires Chaosd agent running on target machines
         - Must specify EITHER address OR selector, not both
+        - With fan_out, mode "all" and several addresses, one resource is
+          created per address and applied concurrently; experiment_ids lists
+          them all, and each must be deleted to stop the chaos
         - Without size parameter, stress-ng will consume all available memory
 
     Raises:
@@ -141,45 +238,41 @@ async def create_physical_stress_memory(
         )
     """
     # Validate targeting parameters
-    if address and selector:
-        raise ValueError("Cannot specify both 'address' and 'selector'. Choose one targeting mode.")
-    if not address and not selector:
-        raise ValueError("Must specify either 'address' or 'selector' for targeting.")
+    _validate_targeting(address, selector)
 
-    name = f"physical-mem-stress-{uuid.uuid4().hex[:8]}"
+    name = generate_name("physical-mem-stress")
 
     action_params = {}
     if size:
         action_params["size"] = size
 
-    yaml_content = render_physical_chaos(
+    names, result = await _apply_physical(
+        render_physical_stress_mem,
         name=name,
         namespace=namespace,
-        action="stress-mem",
         duration=duration,
         mode=mode,
         address=address,
+        fan_out=fan_out,
         selector=selector,
         **action_params
     )
 
-    kubectl = KubectlRunner()
-    result = await kubectl.apply_yaml(yaml_content, namespace)
-
-    return {
-        "experiment_id": name,
-        "kind": "PhysicalMachineChaos",
-        "action": "stress-mem",
-        "namespace": namespace,
-        "target_mode": "address" if address else "selector",
-        "targets": address if address else selector,
-        "parameters": {
+    return ChaosResult(
+        experiment_id=names[0],
+        experiment_ids=names,
+        kind="PhysicalMachineChaos",
+        action="stress-mem",
+        namespace=namespace,
+        target_mode="address" if address else "selector",
+        targets=address if address else selector,
+        parameters={
             "duration": duration,
             "mode": mode,
             "size": size
         },
-        "status": result
-    }
+        status=result
+    )
 
 
 async def create_physical_disk_fill(
@@ -190,8 +283,9 @@ async def create_physical_disk_fill(
     address: Optional[List[str]] = None,
     selector: Optional[Dict[str, str]] = None,
     mode: str = "one",
-    fill_by_fallocate: bool = True
-) -> Dict[str, Any]:
+    fill_by_fallocate: bool = True,
+    fan_out: bool = False
+) -> ChaosResult:
     """Create PhysicalMachineChaos to fill disk space on physical/virtual machines.
 
     Fills disk space by creating large files at the specified path.
@@ -205,6 +299,8 @@ async def create_physical_disk_fill(
         selector: Label selectors for target machines
         mode: Selection mode ("one", "all", "fixed", "fixed-percent", "random-max-percent")
         fill_by_fallocate: Use fallocate for faster filling (default: True)
+        fan_out: With mode "all", create one resource per address and apply
+              them concurrently (default: False)
 
     Returns:
         Chaos experiment details
@@ -212,6 +308,9 @@ async def create_physical_disk_fill(
     Note:
         - Requires Chaosd agent running on target machines
         - Must specify EITHER address OR selector, not both
+        - With fan_out, mode "all" and several addresses, one resource is
+          created per address and applied concurrently; experiment_ids lists
+          them all, and each must be deleted to stop the chaos
         - Target directory must exist and be writable
         - fallocate is faster but may not work on all filesystems
 
@@ -228,12 +327,9 @@ async def create_physical_disk_fill(
         )
     """
     # Validate targeting parameters
-    if address and selector:
-        raise ValueError("Cannot specify both 'address' and 'selector'. Choose one targeting mode.")
-    if not address and not selector:
-        raise ValueError("Must specify either 'address' or 'selector' for targeting.")
+    _validate_targeting(address, selector)
 
-    name = f"physical-disk-fill-{uuid.uuid4().hex[:8]}"
+    name = generate_name("physical-disk-fill")
 
     action_params = {
         "path": path,
@@ -241,36 +337,35 @@ async def create_physical_disk_fill(
         "fill_by_fallocate": fill_by_fallocate
     }
 
-    yaml_content = render_physical_chaos(
+    names, result = await _apply_physical(
+        render_physical_disk_fill,
         name=name,
         namespace=namespace,
-        action="disk-fill",
         duration=duration,
         mode=mode,
         address=address,
+        fan_out=fan_out,
         selector=selector,
         **action_params
     )
 
-    kubectl = KubectlRunner()
-    result = await kubectl.apply_yaml(yaml_content, namespace)
-
-    return {
-        "experiment_id": name,
-        "kind": "PhysicalMachineChaos",
-        "action": "disk-fill",
-        "namespace": namespace,
-        "target_mode": "address" if address else "selector",
-        "targets": address if address else selector,
-        "parameters": {
+    return ChaosResult(
+        experiment_id=names[0],
+        experiment_ids=names,
+        kind="PhysicalMachineChaos",
+        action="disk-fill",
+        namespace=namespace,
+        target_mode="address" if address else "selector",
+        targets=address if address else selector,
+        parameters={
             "duration": duration,
             "mode": mode,
             "path": path,
             "size": size,
             "fill_by_fallocate": fill_by_fallocate
         },
-        "status": result
-    }
+        status=result
+    )
 
 
 async def create_physical_process_kill(
@@ -280,8 +375,9 @@ async def create_physical_process_kill(
     address: Optional[List[str]] = None,
     selector: Optional[Dict[str, str]] = None,
     mode: str = "one",
-    signal: int = 9
-) -> Dict[str, Any]:
+    signal: int = 9,
+    fan_out: bool = False
+) -> ChaosResult:
     """Create PhysicalMachineChaos to kill processes on physical/virtual machines.
 
     Kills processes matching the specified name or pattern.
@@ -294,6 +390,8 @@ async def create_physical_process_kill(
         selector: Label selectors for target machines
         mode: Selection mode ("one", "all", "fixed", "fixed-percent", "random-max-percent")
         signal: Signal number to send (default: 9 for SIGKILL)
+        fan_out: With mode "all", create one resource per address and apply
+              them concurrently (default: False)
 
     Returns:
         Chaos experiment details
@@ -301,6 +399,9 @@ async def create_physical_process_kill(
     Note:
         - Requires Chaosd agent running on target machines
         - Must specify EITHER address OR selector, not both
+        - With fan_out, mode "all" and several addresses, one resource is
+          created per address and applied concurrently; experiment_ids lists
+          them all, and each must be deleted to stop the chaos
         - Common signals: 9 (SIGKILL), 15 (SIGTERM), 2 (SIGINT)
         - Process matching is done via pattern matching
 
@@ -317,47 +418,43 @@ async def create_physical_process_kill(
         )
     """
     # Validate targeting parameters
-    if address and selector:
-        raise ValueError("Cannot specify both 'address' and 'selector'. Choose one targeting mode.")
-    if not address and not selector:
-        raise ValueError("Must specify either 'address' or 'selector' for targeting.")
+    _validate_targeting(address, selector)
 
-    name = f"physical-proc-kill-{uuid.uuid4().hex[:8]}"
+    name = generate_name("physical-proc-kill")
 
     action_params = {
         "process": process,
         "signal": signal
     }
 
-    yaml_content = render_physical_chaos(
+    names, result = await _apply_physical(
+        render_physical_process,
         name=name,
         namespace=namespace,
-        action="process",
         duration=duration,
         mode=mode,
         address=address,
+        fan_out=fan_out,
         selector=selector,
         **action_params
     )
 
-    kubectl = KubectlRunner()
-    result = await kubectl.apply_yaml(yaml_content, namespace)
-
-    return {
-        "experiment_id": name,
-        "kind": "PhysicalMachineChaos",
-        "action": "process-kill",
-        "namespace": namespace,
-        "target_mode": "address" if address else "selector",
-        "targets": address if address else selector,
-        "parameters": {
+    return ChaosResult(
+        experiment_id=names[0],
+        experiment_ids=names,
+        kind="PhysicalMachineChaos",
+        action="process-kill",
+        namespace=namespace,
+        target_mode="address" if address else "selector",
+        targets=address if address else selector,
+        parameters={
             "duration": duration,
             "mode": mode,
             "process": process,
             "signal": signal
         },
-        "status": result
-    }
+        status=result
+    )
 
 
 async def create_physical_clock_skew(
@@ -368,8 +465,9 @@ async def create_physical_clock_skew(
     address: Optional[List[str]] = None,
     selector: Optional[Dict[str, str]] = None,
     mode: str = "one",
-    clock_ids: Optional[List[str]] = None
-) -> Dict[str, Any]:
+    clock_ids: Optional[List[str]] = None,
+    fan_out: bool = False
+) -> ChaosResult:
     """Create PhysicalMachineChaos to skew system clock on physical/virtual machines.
 
     Offsets the system clock by the specified duration for a target process.
@@ -383,6 +481,8 @@ async def create_physical_clock_skew(
         selector: Label selectors for target machines
         mode: Selection mode ("one", "all", "fixed", "fixed-percent", "random-max-percent")
         clock_ids: Clock IDs to skew (default: ["CLOCK_REALTIME"])
+        fan_out: With mode "all", create one resource per address and apply
+              them concurrently (default: False)
 
     Returns:
         Chaos experiment details
@@ -390,6 +490,9 @@ async def create_physical_clock_skew(
     Note:
         - Requires Chaosd agent running on target machines
         - Must specify EITHER address OR selector, not both
+        - With fan_out, mode "all" and several addresses, one resource is
+          created per address and applied concurrently; experiment_ids lists
+          them all, and each must be deleted to stop the chaos
         - PID is REQUIRED for clock skew injection
         - Positive offset moves clock forward, negative moves backward
         - Common clock IDs: CLOCK_REALTIME, CLOCK_MONOTONIC
@@ -409,12 +512,9 @@ async def create_physical_clock_skew(
         )
     """
     # Validate targeting parameters
-    if address and selector:
-        raise ValueError("Cannot specify both 'address' and 'selector'. Choose one targeting mode.")
-    if not address and not selector:
-        raise ValueError("Must specify either 'address' or 'selector' for targeting.")
+    _validate_targeting(address, selector)
 
-    name = f"physical-clock-skew-{uuid.uuid4().hex[:8]}"
+    name = generate_name("physical-clock-skew")
 
     action_params = {
         "time_offset": time_offset,
@@ -423,33 +523,32 @@ async def create_physical_clock_skew(
     if clock_ids:
         action_params["clock_ids"] = clock_ids
 
-    yaml_content = render_physical_chaos(
+    names, result = await _apply_physical(
+        render_physical_clock,
         name=name,
         namespace=namespace,
-        action="clock",
         duration=duration,
         mode=mode,
         address=address,
+        fan_out=fan_out,
         selector=selector,
         **action_params
     )
 
-    kubectl = KubectlRunner()
-    result = await kubectl.apply_yaml(yaml_content, namespace)
-
-    return {
-        "experiment_id": name,
-        "kind": "PhysicalMachineChaos",
-        "action": "clock-skew",
-        "namespace": namespace,
-        "target_mode": "address" if address else "selector",
-        "targets": address if address else selector,
-        "parameters": {
+    return ChaosResult(
+        experiment_id=names[0],
+        experiment_ids=names,
+        kind="PhysicalMachineChaos",
+        action="clock-skew",
+        namespace=namespace,
+        target_mode="address" if address else "selector",
+        targets=address if address else selector,
+        parameters={
             "duration": duration,
             "mode": mode,
             "time_offset": time_offset,
             "pid": pid,
             "clock_ids": clock_ids or ["CLOCK_REALTIME"]
         },
-        "status": result
-    }
+        status=result
+    )
@@ -1,9 +1,10 @@
 """PodChaos tools for MCP."""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Optional, List
 from ..validators import validate_duration, validate_mode, validate_labels
 from ..templates import generate_name, render_pod_chaos
-from ..kubectl import apply_yaml, check_target_exists
+from ..models import ChaosResult
+from ..kubectl import apply_batcher, invalidate_target_cache, start_target_check
 
 
 async def create_pod_kill(
@@ -11,8 +12,10 @@ async def create_pod_kill(
     target_labels: Dict[str, str],
     duration: str,
     mode: str = "one",
-    grace_period: int = 0
-) -> Dict[str, Any]:
+    grace_period: int = 0,
+    skip_target_check: bool = False,
+    pre_validated: bool = False
+) -> ChaosResult:
     """Create PodChaos with pod-kill action.
 
     Kills target pods. Pods will be recreated by their controller (Deployment, StatefulSet, etc.).
@@ -23,44 +26,54 @@ async def create_pod_kill(
         duration: Experiment duration (kills will repeat during this period)
         mode: Selection mode (one/all/fixed/fixed-percent). Default: "one" (safer)
         grace_period: Grace period in seconds before killing. Default: 0 (immediate)
+        skip_target_check: Skip the target pod lookup when the pods are known to exist.
+              affected_pods is then empty. Default: False
+        pre_validated: Skip the format validators for inputs already checked
+              upstream (e.g. by a planner's schema); grace_period is still
+              checked. Default: False
 
     Returns:
         Experiment details
 
     Example:
-        >>> await create_pod_kill(
+        >>> result = await create_pod_kill(
         ...     namespace="default",
         ...     target_labels={"app": "test-service"},
         ...     duration="60s",
         ...     mode="one",
         ...     grace_period=5
         ... )
+        >>> result.to_dict()
         {
             "experiment_id": "pod-kill-a1b2c3d4",
             "kind": "PodChaos",
             "action": "pod-kill",
+            "namespace": "default",
             "affected_pods": ["test-service-0"],
             "parameters": {"grace_period": 5}
         }
     """
-    # Validate
-    validate_labels(target_labels)
-    validate_duration(duration)
-    validate_mode(mode)
+    # Look up target pods while the parameters are validated
+    target_task = start_target_check(namespace, target_labels, skip=skip_target_check)
 
-    if grace_period < 0:
-        raise ValueError(f"Grace period must be >= 0, got {grace_period}")
+    # Validate
+    try:
+        if not pre_validated:
+            validate_labels(target_labels)
+            validate_duration(duration)
+            validate_mode(mode)
+
+        if grace_period < 0:
+            raise ValueError(f"Grace period must be >= 0, got {grace_period}")
+    except Exception:
+        target_task.cancel()
+        raise
 
     # Check target
-    target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    target_check = await target_task
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels} in namespace '{namespace}'")
 
-    # Safety check: warn if mode is "all"
-    if mode == "all" and target_check["count"] > 1:
-        # This will kill ALL pods - potentially dangerous
-        pass  # MCP will log this, user should be aware
-
     # Generate and apply
     name = generate_name("pod-kill")
     yaml_content = render_pod_chaos(
@@ -73,29 +86,35 @@ async def create_pod_kill(
         grace_period=grace_period
     )
 
-    apply_yaml(yaml_content)
+    await apply_batcher.submit(yaml_content)
+    invalidate_target_cache(namespace, target_labels)
 
-    return {
-        "experiment_id": name,
-        "kind": "PodChaos",
-        "action": "pod-kill",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    # Safety note: mode "all" kills every matching pod
+    warning = "Pods will be killed and recreated during the duration" if mode == "all" else None
+
+    return ChaosResult(
+        experiment_id=name,
+        kind="PodChaos",
+        action="pod-kill",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "grace_period": grace_period,
             "mode": mode
         },
-        "duration": duration,
-        "warning": "Pods will be killed and recreated during the duration" if mode == "all" else None
-    }
+        duration=duration,
+        warning=warning
+    )
 
 
 async def create_pod_failure(
     namespace: str,
     target_labels: Dict[str, str],
     duration: str,
-    mode: str = "one"
-) -> Dict[str, Any]:
+    mode: str = "one",
+    skip_target_check: bool = False,
+    pre_validated: bool = False
+) -> ChaosResult:
     """Create PodChaos with pod-failure action.
 
     Makes target pods temporarily unavailable without actually killing them.
@@ -106,6 +125,10 @@ async def create_pod_failure(
         target_labels: Label selectors for target pods
         duration: Experiment duration
         mode: Selection mode. Default: "one"
+        skip_target_check: Skip the target pod lookup when the pods are known to exist.
+              affected_pods is then empty. Default: False
+        pre_validated: Skip parameter validation for inputs already checked
+              upstream (e.g. by a planner's schema). Default: False
 
     Returns:
         Experiment details
@@ -118,14 +141,22 @@ async def create_pod_failure(
         ...     mode="one"
         ... )
     """
+    # Look up target pods while the parameters are validated
+    target_task = start_target_check(namespace, target_labels, skip=skip_target_check)
+
     # Validate
-    validate_labels(target_labels)
-    validate_duration(duration)
-    validate_mode(mode)
+    try:
+        if not pre_validated:
+            validate_labels(target_labels)
+            validate_duration(duration)
+            validate_mode(mode)
+    except Exception:
+        target_task.cancel()
+        raise
 
     # Check target
-    target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    target_check = await target_task
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Generate and apply
@@ -139,19 +170,20 @@ async def create_pod_failure(
         mode=mode
     )
 
-    apply_yaml(yaml_content)
+    await apply_batcher.submit(yaml_content)
+    invalidate_target_cache(namespace, target_labels)
 
-    return {
-        "experiment_id": name,
-        "kind": "PodChaos",
-        "action": "pod-failure",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="PodChaos",
+        action="pod-failure",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "mode": mode
         },
-        "duration": duration
-    }
+        duration=duration
+    )
 
 
 async def create_container_kill(
@@ -159,8 +191,10 @@ async def create_container_kill(
     target_labels: Dict[str, str],
     container_names: List[str],
     duration: str,
-    mode: str = "one"
-) -> Dict[str, Any]:
+    mode: str = "one",
+    skip_target_check: bool = False,
+    pre_validated: bool = False
+) -> ChaosResult:
     """Create PodChaos with container-kill action.
 
     Kills specific containers within pods. Containers will be restarted by kubelet.
@@ -171,6 +205,11 @@ async def create_container_kill(
         container_names: List of container names to kill
         duration: Experiment duration
         mode: Selection mode. Default: "one"
+        skip_target_check: Skip the target pod lookup when the pods are known to exist.
+              affected_pods is then empty. Default: False
+        pre_validated: Skip the format validators for inputs already checked
+              upstream (e.g. by a planner's schema); container_names is still
+              checked. Default: False
 
     Returns:
         Experiment details
@@ -183,17 +222,25 @@ async def create_container_kill(
         ...     duration="60s"
         ... )
     """
-    # Validate
-    validate_labels(target_labels)
-    validate_duration(duration)
-    validate_mode(mode)
+    # Look up target pods while the parameters are validated
+    target_task = start_target_check(namespace, target_labels, skip=skip_target_check)
 
-    if not container_names:
-        raise ValueError("container_names cannot be empty for container-kill action")
+    # Validate
+    try:
+        if not pre_validated:
+            validate_labels(target_labels)
+            validate_duration(duration)
+            validate_mode(mode)
+
+        if not container_names:
+            raise ValueError("container_names cannot be empty for container-kill action")
+    except Exception:
+        target_task.cancel()
+        raise
 
     # Check target
-    target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    target_check = await target_task
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Generate and apply
@@ -208,17 +255,18 @@ async def create_container_kill(
         container_names=container_names
     )
 
-    apply_yaml(yaml_content)
+    await apply_batcher.submit(yaml_content)
+    invalidate_target_cache(namespace, target_labels)
 
-    return {
-        "experiment_id": name,
-        "kind": "PodChaos",
-        "action": "container-kill",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="PodChaos",
+        action="container-kill",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "container_names": container_names,
             "mode": mode
         },
-        "duration": duration
-    }
+        duration=duration
+    )
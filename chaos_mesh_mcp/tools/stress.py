@@ -1,9 +1,10 @@
 """StressChaos tools for MCP."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Optional
 from ..validators import validate_duration, validate_memory_size, validate_mode, validate_labels
 from ..templates import generate_name, render_stress_chaos
-from ..kubectl import apply_yaml, check_target_exists
+from ..models import ChaosResult
+from ..kubectl import apply_batcher, invalidate_target_cache, start_target_check
 
 
 async def create_stress_cpu(
@@ -12,8 +13,10 @@ async def create_stress_cpu(
     workers: int,
     duration: str,
     load: Optional[int] = None,
-    mode: str = "all"
-) -> Dict[str, Any]:
+    mode: str = "all",
+    skip_target_check: bool = False,
+    pre_validated: bool = False
+) -> ChaosResult:
     """Create StressChaos with CPU stress.
 
     Applies CPU stress to target containers.
@@ -26,40 +29,55 @@ async def create_stress_cpu(
         load: CPU load percentage per worker (0-100). Optional.
               0 = no load, 100 = full load on one core
         mode: Selection mode (one/all/fixed/fixed-percent). Default: "all"
+        skip_target_check: Skip the target pod lookup when the pods are known to exist.
+              affected_pods is then empty. Default: False
+        pre_validated: Skip the format validators for inputs already checked
+              upstream (e.g. by a planner's schema); workers and load are still
+              checked. Default: False
 
     Returns:
         Experiment details
 
     Example:
-        >>> await create_stress_cpu(
+        >>> result = await create_stress_cpu(
         ...     namespace="default",
         ...     target_labels={"app": "api-server"},
         ...     workers=4,
         ...     load=80,
         ...     duration="120s"
         ... )
+        >>> result.to_dict()
         {
             "experiment_id": "stress-cpu-f3a2b1c4",
             "kind": "StressChaos",
             "stressor": "cpu",
+            "namespace": "default",
             "affected_pods": ["api-server-0"],
             "parameters": {"workers": 4, "load": 80}
         }
     """
+    # Look up target pods while the parameters are validated
+    target_task = start_target_check(namespace, target_labels, skip=skip_target_check)
+
     # Validate
-    validate_labels(target_labels)
-    validate_duration(duration)
-    validate_mode(mode)
+    try:
+        if not pre_validated:
+            validate_labels(target_labels)
+            validate_duration(duration)
+            validate_mode(mode)
 
-    if workers < 1 or workers > 16:
-        raise ValueError(f"CPU workers must be 1-16, got {workers}")
+        if workers < 1 or workers > 16:
+            raise ValueError(f"CPU workers must be 1-16, got {workers}")
 
-    if load is not None and (load < 0 or load > 100):
-        raise ValueError(f"CPU load must be 0-100, got {load}")
+        if load is not None and (load < 0 or load > 100):
+            raise ValueError(f"CPU load must be 0-100, got {load}")
+    except Exception:
+        target_task.cancel()
+        raise
 
     # Check target
-    target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    target_check = await target_task
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels} in namespace '{namespace}'")
 
     # Generate and apply
@@ -74,20 +92,21 @@ async def create_stress_cpu(
         cpu_load=load
     )
 
-    apply_yaml(yaml_content)
+    await apply_batcher.submit(yaml_content)
+    invalidate_target_cache(namespace, target_labels)
 
-    return {
-        "experiment_id": name,
-        "kind": "StressChaos",
-        "stressor": "cpu",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="StressChaos",
+        stressor="cpu",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "workers": workers,
             "load": load
         },
-        "duration": duration
-    }
+        duration=duration
+    )
 
 
 async def create_stress_memory(
@@ -96,8 +115,10 @@ async def create_stress_memory(
     size: str,
     duration: str,
     workers: int = 1,
-    mode: str = "all"
-) -> Dict[str, Any]:
+    mode: str = "all",
+    skip_target_check: bool = False,
+    pre_validated: bool = False
+) -> ChaosResult:
     """Create StressChaos with memory stress.
 
     Applies memory stress to target containers by allocating and using memory.
@@ -109,6 +130,11 @@ async def create_stress_memory(
         duration: Experiment duration
         workers: Number of memory stress workers. Default: 1
         mode: Selection mode. Default: "all"
+        skip_target_check: Skip the target pod lookup when the pods are known to exist.
+              affected_pods is then empty. Default: False
+        pre_validated: Skip the format validators for inputs already checked
+              upstream (e.g. by a planner's schema); workers is still
+              checked. Default: False
 
     Returns:
         Experiment details
@@ -122,18 +148,26 @@ async def create_stress_memory(
         ...     duration="300s"
         ... )
     """
-    # Validate
-    validate_labels(target_labels)
-    validate_memory_size(size)
-    validate_duration(duration)
-    validate_mode(mode)
+    # Look up target pods while the parameters are validated
+    target_task = start_target_check(namespace, target_labels, skip=skip_target_check)
 
-    if workers < 1 or workers > 8:
-        raise ValueError(f"Memory workers must be 1-8, got {workers}")
+    # Validate
+    try:
+        if not pre_validated:
+            validate_labels(target_labels)
+            validate_memory_size(size)
+            validate_duration(duration)
+            validate_mode(mode)
+
+        if workers < 1 or workers > 8:
+            raise ValueError(f"Memory workers must be 1-8, got {workers}")
+    except Exception:
+        target_task.cancel()
+        raise
 
     # Check target
-    target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    target_check = await target_task
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Generate and apply
@@ -148,20 +182,21 @@ async def create_stress_memory(
         memory_size=size
     )
 
-    apply_yaml(yaml_content)
+    await apply_batcher.submit(yaml_content)
+    invalidate_target_cache(namespace, target_labels)
 
-    return {
-        "experiment_id": name,
-        "kind": "StressChaos",
-        "stressor": "memory",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="StressChaos",
+        stressor="memory",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "workers": workers,
             "size": size
         },
-        "duration": duration
-    }
+        duration=duration
+    )
 
 
 async def create_stress_combined(
@@ -172,8 +207,10 @@ async def create_stress_combined(
     cpu_load: Optional[int],
     memory_workers: int,
     memory_size: str,
-    mode: str = "all"
-) -> Dict[str, Any]:
+    mode: str = "all",
+    skip_target_check: bool = False,
+    pre_validated: bool = False
+) -> ChaosResult:
     """Create StressChaos with both CPU and memory stress.
 
     Applies both CPU and memory stress simultaneously.
@@ -187,19 +224,31 @@ async def create_stress_combined(
         memory_workers: Number of memory stress workers
         memory_size: Memory size to allocate
         mode: Selection mode. Default: "all"
+        skip_target_check: Skip the target pod lookup when the pods are known to exist.
+              affected_pods is then empty. Default: False
+        pre_validated: Skip parameter validation for inputs already checked
+              upstream (e.g. by a planner's schema). Default: False
 
     Returns:
         Experiment details
     """
+    # Look up target pods while the parameters are validated
+    target_task = start_target_check(namespace, target_labels, skip=skip_target_check)
+
     # Validate
-    validate_labels(target_labels)
-    validate_duration(duration)
-    validate_memory_size(memory_size)
-    validate_mode(mode)
+    try:
+        if not pre_validated:
+            validate_labels(target_labels)
+            validate_duration(duration)
+            validate_memory_size(memory_size)
+            validate_mode(mode)
+    except Exception:
+        target_task.cancel()
+        raise
 
     # Check target
-    target_check = check_target_exists(namespace, target_labels)
-    if not target_check["exists"]:
+    target_check = await target_task
+    if not target_check.exists:
         raise ValueError(f"No pods found with labels {target_labels}")
 
     # Generate and apply
@@ -216,19 +265,20 @@ async def create_stress_combined(
         memory_size=memory_size
     )
 
-    apply_yaml(yaml_content)
+    await apply_batcher.submit(yaml_content)
+    invalidate_target_cache(namespace, target_labels)
 
-    return {
-        "experiment_id": name,
-        "kind": "StressChaos",
-        "stressor": "combined",
-        "namespace": namespace,
-        "affected_pods": [p["name"] for p in target_check["pods"]],
-        "parameters": {
+    return ChaosResult(
+        experiment_id=name,
+        kind="StressChaos",
+        stressor="combined",
+        namespace=namespace,
+        affected_pods=list(target_check.pod_names),
+        parameters={
             "cpu_workers": cpu_workers,
             "cpu_load": cpu_load,
             "memory_workers": memory_workers,
             "memory_size": memory_size
         },
-        "duration": duration
-    }
+        duration=duration
+    )
@@ -1,9 +1,112 @@
 """Environment validation tools for Chaos Mesh prerequisites."""
 
-from typing import Dict, Any, List, Optional
+import asyncio
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from ..kubectl import KubectlRunner
 
 
+EXPECTED_CRDS = (
+    "networkchaos.chaos-mesh.org",
+    "podchaos.chaos-mesh.org",
+    "stresschaos.chaos-mesh.org",
+    "iochaos.chaos-mesh.org",
+    "httpchaos.chaos-mesh.org",
+    "dnschaos.chaos-mesh.org",
+    "physicalmachinechaos.chaos-mesh.org",
+)
+
+# Component requirements
+REQUIRED_COMPONENTS = (
+    "chaos-controller-manager",
+    "chaos-daemon",
+)
+
+OPTIONAL_COMPONENTS = {
+    "chaos-dns-server": "Required for DNSChaos",
+    "chaos-dashboard": "Optional web UI",
+}
+
+_ALL_COMPONENTS = REQUIRED_COMPONENTS + tuple(OPTIONAL_COMPONENTS)
+
+_REQUIREMENTS_MAP: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    "dns": {
+        "chaos_kind": "DNSChaos",
+        "crd": "dnschaos.chaos-mesh.org",
+        "required_components": ["chaos-controller-manager", "chaos-daemon", "chaos-dns-server"],
+        "optional_components": [],
+        "additional_notes": [
+            "chaos-dns-server pod must be running in chaos-mesh namespace",
+            "Only supports A and AAAA DNS record types",
+            "Wildcard patterns (*) must be at end of domain"
+        ]
+    },
+    "physical": {
+        "chaos_kind": "PhysicalMachineChaos",
+        "crd": "physicalmachinechaos.chaos-mesh.org",
+        "required_components": ["chaos-controller-manager"],
+        "optional_components": [],
+        "external_requirements": [
+            "Chaosd agent must be running on target physical/virtual machines",
+            "Chaosd must be configured to connect to Chaos Mesh controller",
+            "Target machines must be registered via address or selector"
+        ],
+        "additional_notes": [
+            "Does not require chaos-daemon (operates outside cluster)",
+            "Supports: stress-cpu, stress-mem, disk-fill, process-kill, clock-skew actions",
+            "Must specify EITHER address OR selector for targeting"
+        ]
+    },
+    "network": {
+        "chaos_kind": "NetworkChaos",
+        "crd": "networkchaos.chaos-mesh.org",
+        "required_components": ["chaos-controller-manager", "chaos-daemon"],
+        "optional_components": [],
+        "additional_notes": [
+            "Supports: delay, loss, corrupt, duplicate, partition, bandwidth actions"
+        ]
+    },
+    "pod": {
+        "chaos_kind": "PodChaos",
+        "crd": "podchaos.chaos-mesh.org",
+        "required_components": ["chaos-controller-manager", "chaos-daemon"],
+        "optional_components": [],
+        "additional_notes": [
+            "Supports: pod-kill, pod-failure, container-kill actions"
+        ]
+    },
+    "stress": {
+        "chaos_kind": "StressChaos",
+        "crd": "stresschaos.chaos-mesh.org",
+        "required_components": ["chaos-controller-manager", "chaos-daemon"],
+        "optional_components": [],
+        "additional_notes": [
+            "Uses stress-ng inside target containers"
+        ]
+    },
+    "io": {
+        "chaos_kind": "IOChaos",
+        "crd": "iochaos.chaos-mesh.org",
+        "required_components": ["chaos-controller-manager", "chaos-daemon"],
+        "optional_components": [],
+        "additional_notes": [
+            "Supports: latency, fault, attrOverride, mistake actions",
+            "Requires volume path and file path pattern"
+        ]
+    },
+    "http": {
+        "chaos_kind": "HTTPChaos",
+        "crd": "httpchaos.chaos-mesh.org",
+        "required_components": ["chaos-controller-manager", "chaos-daemon"],
+        "optional_components": [],
+        "additional_notes": [
+            "Supports: abort, delay, replace, patch actions",
+            "Requires port number of target service"
+        ]
+    }
+})
+
+
 async def check_kubectl_available() -> Dict[str, Any]:
     """Check if kubectl is available and working.
 
@@ -56,11 +159,11 @@ async def check_chaos_mesh_installed() -> Dict[str, Any]:
     """
     kubectl = KubectlRunner()
     try:
-        # Check for chaos-mesh namespace
-        result = await kubectl.run_command("get namespace chaos-mesh -o json")
-
-        # Check for Chaos Mesh pods
-        pods = await kubectl.run_command("get pods -n chaos-mesh -o json")
+        # Check for chaos-mesh namespace and its pods
+        result, pods = await asyncio.gather(
+            kubectl.run_command("get namespace chaos-mesh -o json"),
+            kubectl.run_command("get pods -n chaos-mesh -o json")
+        )
         pod_items = pods.get("items", [])
 
         running_pods = [
@@ -98,41 +201,32 @@ async def check_chaos_mesh_crds() -> Dict[str, Any]:
     """
     kubectl = KubectlRunner()
 
-    expected_crds = [
-        "networkchaos.chaos-mesh.org",
-        "podchaos.chaos-mesh.org",
-        "stresschaos.chaos-mesh.org",
-        "iochaos.chaos-mesh.org",
-        "httpchaos.chaos-mesh.org",
-        "dnschaos.chaos-mesh.org",
-        "physicalmachinechaos.chaos-mesh.org",
-    ]
-
     try:
         result = await kubectl.run_command("get crd -o json")
-        installed_crds = [
-            item["metadata"]["name"]
-            for item in result.get("items", [])
-            if item["metadata"]["name"].endswith("chaos-mesh.org")
-        ]
+        installed_set = {
+            name
+            for name in (item["metadata"]["name"] for item in result.get("items", []))
+            if name.endswith("chaos-mesh.org")
+        }
 
-        missing_crds = [crd for crd in expected_crds if crd not in installed_crds]
+        installed_crds = [crd for crd in EXPECTED_CRDS if crd in installed_set]
+        missing_crds = [crd for crd in EXPECTED_CRDS if crd not in installed_set]
 
         return {
             "all_installed": len(missing_crds) == 0,
-            "installed_count": len([crd for crd in expected_crds if crd in installed_crds]),
-            "total_expected": len(expected_crds),
-            "installed_crds": [crd for crd in expected_crds if crd in installed_crds],
+            "installed_count": len(installed_crds),
+            "total_expected": len(EXPECTED_CRDS),
+            "installed_crds": installed_crds,
             "missing_crds": missing_crds,
-            "message": f"{len(expected_crds) - len(missing_crds)}/{len(expected_crds)} Chaos Mesh CRDs installed"
+            "message": f"{len(installed_crds)}/{len(EXPECTED_CRDS)} Chaos Mesh CRDs installed"
         }
     except Exception as e:
         return {
             "all_installed": False,
             "installed_count": 0,
-            "total_expected": len(expected_crds),
+            "total_expected": len(EXPECTED_CRDS),
             "installed_crds": [],
-            "missing_crds": expected_crds,
+            "missing_crds": list(EXPECTED_CRDS),
             "message": f"Failed to check CRDs: {str(e)}"
         }
 
@@ -145,60 +239,43 @@ async def check_chaos_components() -> Dict[str, Any]:
     """
     kubectl = KubectlRunner()
 
-    # Component requirements
-    required_components = [
-        "chaos-controller-manager",
-        "chaos-daemon"
-    ]
-
-    optional_components = {
-        "chaos-dns-server": "Required for DNSChaos",
-        "chaos-dashboard": "Optional web UI"
-    }
-
     try:
         pods = await kubectl.run_command("get pods -n chaos-mesh -o json")
         pod_items = pods.get("items", [])
 
+        # Count pods per component in a single pass
+        buckets = {c: {"total": 0, "running": 0} for c in _ALL_COMPONENTS}
+        for pod in pod_items:
+            pod_name = pod["metadata"]["name"]
+            for component in _ALL_COMPONENTS:
+                if component in pod_name:
+                    bucket = buckets[component]
+                    bucket["total"] += 1
+                    if pod.get("status", {}).get("phase") == "Running":
+                        bucket["running"] += 1
+                    break
+
         component_status = {}
 
         # Check required components
-        for component in required_components:
-            matching_pods = [
-                pod for pod in pod_items
-                if component in pod["metadata"]["name"]
-            ]
-
-            running = sum(
-                1 for pod in matching_pods
-                if pod.get("status", {}).get("phase") == "Running"
-            )
-
+        for component in REQUIRED_COMPONENTS:
+            bucket = buckets[component]
             component_status[component] = {
                 "type": "required",
-                "total": len(matching_pods),
-                "running": running,
-                "status": "OK" if running > 0 else "MISSING",
+                "total": bucket["total"],
+                "running": bucket["running"],
+                "status": "OK" if bucket["running"] > 0 else "MISSING",
                 "required_for": "All chaos types"
             }
 
         # Check optional components
-        for component, purpose in optional_components.items():
-            matching_pods = [
-                pod for pod in pod_items
-                if component in pod["metadata"]["name"]
-            ]
-
-            running = sum(
-                1 for pod in matching_pods
-                if pod.get("status", {}).get("phase") == "Running"
-            )
-
+        for component, purpose in OPTIONAL_COMPONENTS.items():
+            bucket = buckets[component]
             component_status[component] = {
                 "type": "optional",
-                "total": len(matching_pods),
-                "running": running,
-                "status": "OK" if running > 0 else "NOT_INSTALLED",
+                "total": bucket["total"],
+                "running": bucket["running"],
+                "status": "OK" if bucket["running"] > 0 else "NOT_INSTALLED",
                 "required_for": purpose
             }
 
@@ -223,99 +300,28 @@ async def check_chaos_components() -> Dict[str, Any]:
         }
 
 
-async def get_chaos_requirements(chaos_type: str) -> Dict[str, Any]:
+def get_chaos_requirements(chaos_type: str) -> Dict[str, Any]:
     """Get specific requirements for a chaos type.
 
     Args:
         chaos_type: Type of chaos (e.g., "dns", "physical", "network")
 
     Returns:
-        Requirements for the specified chaos type
+        Requirements for the specified chaos type, as a fresh copy the
+        caller may modify
     """
-    requirements_map = {
-        "dns": {
-            "chaos_kind": "DNSChaos",
-            "crd": "dnschaos.chaos-mesh.org",
-            "required_components": ["chaos-controller-manager", "chaos-daemon", "chaos-dns-server"],
-            "optional_components": [],
-            "additional_notes": [
-                "chaos-dns-server pod must be running in chaos-mesh namespace",
-                "Only supports A and AAAA DNS record types",
-                "Wildcard patterns (*) must be at end of domain"
-            ]
-        },
-        "physical": {
-            "chaos_kind": "PhysicalMachineChaos",
-            "crd": "physicalmachinechaos.chaos-mesh.org",
-            "required_components": ["chaos-controller-manager"],
-            "optional_components": [],
-            "external_requirements": [
-                "Chaosd agent must be running on target physical/virtual machines",
-                "Chaosd must be configured to connect to Chaos Mesh controller",
-                "Target machines must be registered via address or selector"
-            ],
-            "additional_notes": [
-                "Does not require chaos-daemon (operates outside cluster)",
-                "Supports: stress-cpu, stress-mem, disk-fill, process-kill, clock-skew actions",
-                "Must specify EITHER address OR selector for targeting"
-            ]
-        },
-        "network": {
-            "chaos_kind": "NetworkChaos",
-            "crd": "networkchaos.chaos-mesh.org",
-            "required_components": ["chaos-controller-manager", "chaos-daemon"],
-            "optional_components": [],
-            "additional_notes": [
-                "Supports: delay, loss, corrupt, duplicate, partition, bandwidth actions"
-            ]
-        },
-        "pod": {
-            "chaos_kind": "PodChaos",
-            "crd": "podchaos.chaos-mesh.org",
-            "required_components": ["chaos-controller-manager", "chaos-daemon"],
-            "optional_components": [],
-            "additional_notes": [
-                "Supports: pod-kill, pod-failure, container-kill actions"
-            ]
-        },
-        "stress": {
-            "chaos_kind": "StressChaos",
-            "crd": "stresschaos.chaos-mesh.org",
-            "required_components": ["chaos-controller-manager", "chaos-daemon"],
-            "optional_components": [],
-            "additional_notes": [
-                "Uses stress-ng inside target containers"
-            ]
-        },
-        "io": {
-            "chaos_kind": "IOChaos",
-            "crd": "iochaos.chaos-mesh.org",
-            "required_components": ["chaos-controller-manager", "chaos-daemon"],
-            "optional_components": [],
-            "additional_notes": [
-                "Supports: latency, fault, attrOverride, mistake actions",
-                "Requires volume path and file path pattern"
-            ]
-        },
-        "http": {
-            "chaos_kind": "HTTPChaos",
-            "crd": "httpchaos.chaos-mesh.org",
-            "required_components": ["chaos-controller-manager", "chaos-daemon"],
-            "optional_components": [],
-            "additional_notes": [
-                "Supports: abort, delay, replace, patch actions",
-                "Requires port number of target service"
-            ]
-        }
-    }
-
-    if chaos_type.lower() not in requirements_map:
+    requirements = _REQUIREMENTS_MAP.get(chaos_type.lower())
+    if requirements is None:
         return {
             "error": f"Unknown chaos type: {chaos_type}",
-            "supported_types": list(requirements_map.keys())
+            "supported_types": list(_REQUIREMENTS_MAP)
         }
 
-    return requirements_map[chaos_type.lower()]
+    # The table is shared, so copy its lists along with the dict
+    return {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in requirements.items()
+    }
 
 
 async def validate_environment() -> Dict[str, Any]:
@@ -370,11 +376,11 @@ async def validate_environment() -> Dict[str, Any]:
             ]
         }
 
-    # 4. Check CRDs
-    results["crds"] = await check_chaos_mesh_crds()
-
-    # 5. Check components
-    results["components"] = await check_chaos_components()
+    # 4-5. Check CRDs and components (independent of each other)
+    results["crds"], results["components"] = await asyncio.gather(
+        check_chaos_mesh_crds(),
+        check_chaos_components()
+    )
 
     # Determine overall validity
     all_valid = (
@@ -412,18 +418,18 @@ async def check_chaos_type_requirements(chaos_type: str) -> Dict[str, Any]:
         Validation result specific to the chaos type
     """
     # Get requirements
-    requirements = await get_chaos_requirements(chaos_type)
+    requirements = get_chaos_requirements(chaos_type)
 
     if "error" in requirements:
         return requirements
 
-    # Check CRD
-    crds_check = await check_chaos_mesh_crds()
+    # Check CRD and components
+    crds_check, components_check = await asyncio.gather(
+        check_chaos_mesh_crds(),
+        check_chaos_components()
+    )
     crd_installed = requirements["crd"] in crds_check["installed_crds"]
 
-    # Check components
-    components_check = await check_chaos_components()
-
     component_status = {}
     all_required_ok = True
 
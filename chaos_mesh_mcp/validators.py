@@ -1,7 +1,8 @@
 """Parameter validation utilities for Chaos Mesh."""
 
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 
 class ValidationError(Exception):
@@ -9,6 +10,53 @@ class ValidationError(Exception):
     pass
 
 
+# Units accepted after a decimal number
+_ASCII_DIGITS = "0123456789"
+_DURATION_UNITS = frozenset({"ms", "s", "m", "h"})
+_MEM_UNITS = frozenset({"B", "KB", "MB", "GB", "TB"})
+_BW_UNITS = frozenset({"bit", "kbit", "mbit", "gbit", "bps", "kbps", "mbps", "gbps"})
+
+_VALID_MODES = frozenset({"one", "all", "fixed", "fixed-percent", "random-max-percent"})
+_VALID_MODES_MSG = "one, all, fixed, fixed-percent, random-max-percent"
+_VALID_DIRECTIONS = frozenset({"to", "from", "both"})
+_VALID_DIRECTIONS_MSG = "to, from, both"
+
+_STR_ONLY = frozenset({str})
+# Segments may not end in '-'; _is_valid_label_key checks that after matching
+_LABEL_KEY_RE = re.compile(r'[a-z0-9][-a-z0-9]*(?:\.[a-z0-9][-a-z0-9]*)*')
+
+
+# Validators see a small vocabulary of recurring values ("1s", "256MB"),
+# so the format checks are memoized per input string
+@lru_cache(maxsize=256)
+def _is_valid_duration(duration: str) -> bool:
+    # lstrip runs the digit scan in C
+    unit = duration.lstrip(_ASCII_DIGITS)
+    return len(unit) < len(duration) and unit in _DURATION_UNITS
+
+
+@lru_cache(maxsize=256)
+def _is_valid_memory_size(size: str) -> bool:
+    unit = size.lstrip(_ASCII_DIGITS)
+    return len(unit) < len(size) and unit.upper() in _MEM_UNITS
+
+
+@lru_cache(maxsize=256)
+def _is_valid_bandwidth(rate: str) -> bool:
+    unit = rate.lstrip(_ASCII_DIGITS)
+    return len(unit) < len(rate) and unit.lower() in _BW_UNITS
+
+
+def _check_duration(duration: str) -> Optional[str]:
+    """Return an error message for an invalid duration, or None."""
+    if _is_valid_duration(duration):
+        return None
+    return (
+        f"Invalid duration format: '{duration}'. "
+        "Expected format: <number><unit> (e.g., '10ms', '1s', '2m', '1h')"
+    )
+
+
 def validate_duration(duration: str) -> None:
     """Validate duration format (e.g., '10ms', '1s', '2m', '1h').
 
@@ -18,13 +66,57 @@ def validate_duration(duration: str) -> None:
     Raises:
         ValidationError: If format is invalid
     """
-    if not re.match(r'^\d+(ms|s|m|h)$', duration):
+    error = _check_duration(duration)
+    if error is not None:
+        raise ValidationError(error)
+
+
+def _quote_all(values: List[str]) -> str:
+    """Format values for an error message listing several inputs."""
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def validate_durations(*durations: str) -> None:
+    """Validate several duration strings, checking each distinct value once.
+
+    Args:
+        *durations: Duration strings
+
+    Raises:
+        ValidationError: If any format is invalid; lists every invalid value
+    """
+    invalid = [d for d in dict.fromkeys(durations) if not _is_valid_duration(d)]
+    if invalid:
         raise ValidationError(
-            f"Invalid duration format: '{duration}'. "
+            f"Invalid duration format: {_quote_all(invalid)}. "
             "Expected format: <number><unit> (e.g., '10ms', '1s', '2m', '1h')"
         )
 
 
+def _is_valid_percentage(value: str) -> bool:
+    # Fast path for plain integers such as "50"; anything else goes
+    # through float()
+    if isinstance(value, str) and len(value) <= 3 and value.isdecimal():
+        return int(value) <= 100
+
+    try:
+        return 0 <= float(value) <= 100
+    except ValueError:
+        return False
+
+
+def _check_percentage(value: str) -> Optional[str]:
+    """Return an error message for an invalid percentage, or None."""
+    if _is_valid_percentage(value):
+        return None
+
+    try:
+        float(value)
+    except ValueError:
+        return f"Invalid percentage value: {value}"
+    return f"Percentage must be 0-100, got {value}"
+
+
 def validate_percentage(value: str) -> None:
     """Validate percentage value (0-100).
 
@@ -34,12 +126,35 @@ def validate_percentage(value: str) -> None:
     Raises:
         ValidationError: If not in valid range
     """
-    try:
-        num = float(value)
-        if not 0 <= num <= 100:
-            raise ValidationError(f"Percentage must be 0-100, got {value}")
-    except ValueError:
-        raise ValidationError(f"Invalid percentage value: {value}")
+    error = _check_percentage(value)
+    if error is not None:
+        raise ValidationError(error)
+
+
+def validate_percentages(*values: str) -> None:
+    """Validate several percentage values, checking each distinct value once.
+
+    Args:
+        *values: Percentages as strings
+
+    Raises:
+        ValidationError: If any value is invalid; lists every invalid value
+    """
+    invalid = [v for v in dict.fromkeys(values) if not _is_valid_percentage(v)]
+    if len(invalid) == 1:
+        raise ValidationError(_check_percentage(invalid[0]))
+    if invalid:
+        raise ValidationError(f"Percentages must be numbers in 0-100, got {_quote_all(invalid)}")
+
+
+def _check_memory_size(size: str) -> Optional[str]:
+    """Return an error message for an invalid memory size, or None."""
+    if _is_valid_memory_size(size):
+        return None
+    return (
+        f"Invalid memory size format: '{size}'. "
+        "Expected format: <number><unit> (e.g., '256MB', '1GB')"
+    )
 
 
 def validate_memory_size(size: str) -> None:
@@ -51,13 +166,35 @@ def validate_memory_size(size: str) -> None:
     Raises:
         ValidationError: If format is invalid
     """
-    if not re.match(r'^\d+(B|KB|MB|GB|TB)$', size, re.IGNORECASE):
+    error = _check_memory_size(size)
+    if error is not None:
+        raise ValidationError(error)
+
+
+def validate_memory_sizes(*sizes: str) -> None:
+    """Validate several memory size strings, checking each distinct value once.
+
+    Args:
+        *sizes: Memory size strings
+
+    Raises:
+        ValidationError: If any format is invalid; lists every invalid value
+    """
+    invalid = [s for s in dict.fromkeys(sizes) if not _is_valid_memory_size(s)]
+    if invalid:
         raise ValidationError(
-            f"Invalid memory size format: '{size}'. "
+            f"Invalid memory size format: {_quote_all(invalid)}. "
             "Expected format: <number><unit> (e.g., '256MB', '1GB')"
         )
 
 
+def _check_mode(mode: str) -> Optional[str]:
+    """Return an error message for an invalid mode, or None."""
+    if isinstance(mode, str) and mode in _VALID_MODES:
+        return None
+    return f"Invalid mode: '{mode}'. Valid modes: {_VALID_MODES_MSG}"
+
+
 def validate_mode(mode: str) -> None:
     """Validate Chaos Mesh mode.
 
@@ -67,12 +204,16 @@ def validate_mode(mode: str) -> None:
     Raises:
         ValidationError: If mode is invalid
     """
-    valid_modes = ["one", "all", "fixed", "fixed-percent", "random-max-percent"]
-    if mode not in valid_modes:
-        raise ValidationError(
-            f"Invalid mode: '{mode}'. "
-            f"Valid modes: {', '.join(valid_modes)}"
-        )
+    error = _check_mode(mode)
+    if error is not None:
+        raise ValidationError(error)
+
+
+def _check_direction(direction: str) -> Optional[str]:
+    """Return an error message for an invalid direction, or None."""
+    if isinstance(direction, str) and direction in _VALID_DIRECTIONS:
+        return None
+    return f"Invalid direction: '{direction}'. Valid directions: {_VALID_DIRECTIONS_MSG}"
 
 
 def validate_direction(direction: str) -> None:
@@ -84,12 +225,19 @@ def validate_direction(direction: str) -> None:
     Raises:
         ValidationError: If direction is invalid
     """
-    valid_directions = ["to", "from", "both"]
-    if direction not in valid_directions:
-        raise ValidationError(
-            f"Invalid direction: '{direction}'. "
-            f"Valid directions: {', '.join(valid_directions)}"
-        )
+    error = _check_direction(direction)
+    if error is not None:
+        raise ValidationError(error)
+
+
+def _check_bandwidth(rate: str) -> Optional[str]:
+    """Return an error message for an invalid bandwidth, or None."""
+    if _is_valid_bandwidth(rate):
+        return None
+    return (
+        f"Invalid bandwidth format: '{rate}'. "
+        "Expected format: <number><unit> (e.g., '1mbit', '100kbps')"
+    )
 
 
 def validate_bandwidth(rate: str) -> None:
@@ -101,11 +249,44 @@ def validate_bandwidth(rate: str) -> None:
     Raises:
         ValidationError: If format is invalid
     """
-    if not re.match(r'^\d+(bit|kbit|mbit|gbit|bps|kbps|mbps|gbps)$', rate, re.IGNORECASE):
-        raise ValidationError(
-            f"Invalid bandwidth format: '{rate}'. "
-            "Expected format: <number><unit> (e.g., '1mbit', '100kbps')"
-        )
+    error = _check_bandwidth(rate)
+    if error is not None:
+        raise ValidationError(error)
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_label_key(key: str) -> bool:
+    """Check a label key; planners reuse the same labels across experiments."""
+    return (
+        _LABEL_KEY_RE.fullmatch(key) is not None
+        and key[-1] != "-"
+        and "-." not in key
+    )
+
+
+def _first_label_error(labels: Dict[str, str]) -> Optional[str]:
+    """Return the error message for the first invalid label, or None.
+
+    Each key is checked before its value, in dict order.
+    """
+    for key, value in labels.items():
+        if not _is_valid_label_key(key):
+            return f"Invalid label key: '{key}'"
+        if type(value) is not str:
+            return f"Label value must be string, got {type(value)}"
+    return None
+
+
+def _check_labels(labels: Dict[str, str]) -> Optional[str]:
+    """Return an error message for the first invalid label, or None."""
+    if not labels:
+        return "Label selectors cannot be empty"
+
+    # Collapse values to their distinct types; unlike the values themselves,
+    # types are always hashable
+    if all(map(_is_valid_label_key, labels)) and {*map(type, labels.values())} <= _STR_ONLY:
+        return None
+    return _first_label_error(labels)
 
 
 def validate_labels(labels: Dict[str, str]) -> None:
@@ -117,11 +298,46 @@ def validate_labels(labels: Dict[str, str]) -> None:
     Raises:
         ValidationError: If labels are invalid
     """
-    if not labels:
-        raise ValidationError("Label selectors cannot be empty")
+    error = _check_labels(labels)
+    if error is not None:
+        raise ValidationError(error)
 
-    for key, value in labels.items():
-        if not re.match(r'^[a-z0-9]([-a-z0-9]*[a-z0-9])?(\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*$', key):
-            raise ValidationError(f"Invalid label key: '{key}'")
-        if not isinstance(value, str):
-            raise ValidationError(f"Label value must be string, got {type(value)}")
+
+# Tool parameter name -> message-returning check, for validate_spec
+_FIELD_CHECKS = {
+    "duration": _check_duration,
+    "latency": _check_duration,
+    "jitter": _check_duration,
+    "loss": _check_percentage,
+    "corrupt": _check_percentage,
+    "correlation": _check_percentage,
+    "size": _check_memory_size,
+    "memory_size": _check_memory_size,
+    "rate": _check_bandwidth,
+    "mode": _check_mode,
+    "direction": _check_direction,
+    "target_labels": _check_labels,
+}
+
+
+def validate_spec(spec: Dict[str, Any]) -> None:
+    """Validate several tool parameters in one pass, keyed by parameter name.
+
+    Fields without a known check are ignored.
+
+    Args:
+        spec: Parameter name to value (e.g., {"duration": "60s", "mode": "all"})
+
+    Raises:
+        ValidationError: If any field is invalid; lists every error, in spec order
+    """
+    checks = _FIELD_CHECKS
+    errors = []
+    for field, value in spec.items():
+        check = checks.get(field)
+        if check is not None:
+            error = check(value)
+            if error is not None:
+                errors.append(error)
+    if errors:
+        raise ValidationError("; ".join(errors))
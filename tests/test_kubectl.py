@@ -0,0 +1,246 @@
+"""Tests for kubectl helpers."""
+
+import asyncio
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from chaos_mesh_mcp import kubectl
+from chaos_mesh_mcp.kubectl import KubectlError, KubectlProxy, KubectlRunner, YamlApplyBatcher
+
+
+FAKE_KUBECTL = """#!/bin/sh
+echo "$1" >> "$KUBECTL_LOG"
+case "$1" in
+  proxy)
+    [ -n "$STUB_PORT" ] || exit 1
+    echo "Starting to serve on 127.0.0.1:$STUB_PORT"
+    exec sleep 60
+    ;;
+  apply)
+    cat > /dev/null
+    echo "networkchaos.chaos-mesh.org/test configured"
+    ;;
+esac
+"""
+
+RESOURCE = """apiVersion: chaos-mesh.org/v1alpha1
+kind: NetworkChaos
+metadata:
+  name: test
+  namespace: default
+spec: {}
+"""
+
+
+@pytest.fixture
+def fake_apply(monkeypatch):
+    """Record kubectl applies; documents containing "bad" fail."""
+    calls = {"batches": [], "single": []}
+
+    def apply_yaml_documents(documents):
+        documents = list(documents)
+        calls["batches"].append(documents)
+        if any("bad" in doc for doc in documents):
+            raise KubectlError("kubectl apply failed: bad document")
+        return {"status": "applied", "output": "\n".join(f"{doc} created" for doc in documents)}
+
+    def apply_yaml(yaml_content):
+        calls["single"].append(yaml_content)
+        if "bad" in yaml_content:
+            raise KubectlError("kubectl apply failed: bad document")
+        return {"status": "applied", "output": f"{yaml_content} created"}
+
+    monkeypatch.setattr(kubectl, "apply_yaml_documents", apply_yaml_documents)
+    monkeypatch.setattr(kubectl, "apply_yaml", apply_yaml)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_batcher_coalesces_concurrent_submits(fake_apply):
+    """Test that concurrent submits share one kubectl apply."""
+    batcher = YamlApplyBatcher(max_batch=16, max_wait_ms=10)
+
+    first, second = await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+
+    assert fake_apply["batches"] == [["a", "b"]]
+    assert first["output"] == "a created"
+    assert second["output"] == "b created"
+
+
+@pytest.mark.asyncio
+async def test_batcher_falls_back_to_single_applies(fake_apply):
+    """Test that a failed batch is retried per document."""
+    batcher = YamlApplyBatcher(max_batch=16, max_wait_ms=10)
+
+    good, bad = await asyncio.gather(
+        batcher.submit("good"), batcher.submit("bad"), return_exceptions=True
+    )
+
+    assert fake_apply["batches"] == [["good", "bad"]]
+    assert sorted(fake_apply["single"]) == ["bad", "good"]
+    assert good["output"] == "good created"
+    assert isinstance(bad, KubectlError)
+
+
+@pytest.mark.asyncio
+async def test_batcher_skips_cancelled_submits(fake_apply):
+    """Test that a document is not applied once its caller is cancelled."""
+    batcher = YamlApplyBatcher(max_batch=16, max_wait_ms=10)
+
+    cancelled = asyncio.ensure_future(batcher.submit("cancelled"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    result = await batcher.submit("kept")
+
+    assert result["output"] == "kept created"
+    assert fake_apply["single"] == ["kept"]
+    assert fake_apply["batches"] == []
+
+
+def test_batcher_survives_closed_loop(fake_apply):
+    """Test that a submit cancelled with its loop does not stall later loops."""
+    batcher = YamlApplyBatcher(max_batch=16, max_wait_ms=10)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(batcher.submit("first"), 0.001))
+
+    result = asyncio.run(asyncio.wait_for(batcher.submit("second"), 1))
+    assert result["output"] == "second created"
+
+
+@pytest.fixture
+def fake_kubectl(tmp_path, monkeypatch):
+    """Put a fake kubectl on PATH that logs each subcommand it runs."""
+    script = tmp_path / "kubectl"
+    script.write_text(FAKE_KUBECTL)
+    script.chmod(0o755)
+    log = tmp_path / "kubectl.log"
+    log.touch()
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("KUBECTL_LOG", str(log))
+    return lambda: log.read_text().split()
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    """Serve canned responses to the proxy's POSTs."""
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            requests.append(self.path)
+            status = self.server.statuses.pop(0)
+            body = b'{"message": "already exists"}' if status == 409 else b"{}"
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    server.statuses = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("STUB_PORT", str(server.server_port))
+    yield server, requests
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_apply_through_proxy(fake_kubectl, stub_api, monkeypatch):
+    """Test that applies reuse one proxy and fall back to apply on 409."""
+    server, requests = stub_api
+    server.statuses = [201, 409]
+    proxy = KubectlProxy()
+    monkeypatch.setattr(kubectl, "_proxy", proxy)
+
+    try:
+        created = await KubectlRunner().apply_yaml(RESOURCE)
+        existing = await KubectlRunner().apply_yaml(RESOURCE)
+    finally:
+        proxy.stop()
+
+    assert requests == ["/apis/chaos-mesh.org/v1alpha1/namespaces/default/networkchaos"] * 2
+    assert created["output"] == "networkchaos.chaos-mesh.org/test created"
+    assert existing["output"] == "networkchaos.chaos-mesh.org/test configured"
+    assert fake_kubectl() == ["proxy", "apply"]
+
+
+@pytest.mark.asyncio
+async def test_failed_proxy_start_is_not_retried(fake_kubectl, monkeypatch):
+    """Test that after the proxy fails to start, applies go straight to kubectl apply."""
+    monkeypatch.delenv("STUB_PORT", raising=False)
+    monkeypatch.setattr(kubectl, "_proxy", KubectlProxy(retry_after=60))
+
+    for _ in range(3):
+        result = await KubectlRunner().apply_yaml(RESOURCE)
+        assert result["status"] == "applied"
+
+    assert fake_kubectl() == ["proxy", "apply", "apply", "apply"]
+
+
+@pytest.mark.asyncio
+async def test_cached_target_check_is_not_shared(monkeypatch):
+    """Test that mutating a result's affected_pods leaves the cache intact."""
+    from chaos_mesh_mcp.tools import network
+
+    pods = kubectl.TargetCheck(True, 2, (), ("web-0", "web-1"))
+    monkeypatch.setattr(kubectl, "_fetch_target_pods", lambda namespace, labels: pods)
+    monkeypatch.setattr(network, "apply_yaml", lambda yaml_content: {"status": "applied"})
+    kubectl._target_cache.clear()
+
+    try:
+        first = await network.create_network_loss("default", {"app": "web"}, loss="10", duration="60s")
+        first.affected_pods.append("ghost")
+        second = await network.create_network_loss("default", {"app": "web"}, loss="10", duration="60s")
+    finally:
+        kubectl._target_cache.clear()
+
+    assert second.affected_pods == ["web-0", "web-1"]
+
+
+@pytest.mark.asyncio
+async def test_batcher_reports_os_errors(monkeypatch):
+    """Test that an OSError from kubectl reaches every caller instead of hanging."""
+    def missing_kubectl(*args):
+        raise FileNotFoundError("kubectl")
+
+    monkeypatch.setattr(kubectl, "apply_yaml_documents", missing_kubectl)
+    monkeypatch.setattr(kubectl, "apply_yaml", missing_kubectl)
+    batcher = YamlApplyBatcher(max_batch=16, max_wait_ms=10)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True), 1
+    )
+    assert [type(r) for r in results] == [FileNotFoundError, FileNotFoundError]
+    with pytest.raises(FileNotFoundError):
+        await asyncio.wait_for(batcher.submit("c"), 1)
+
+
+def test_get_cache_is_per_loop(monkeypatch):
+    """Test that a lookup cancelled with its loop is not reused by the next loop."""
+    from chaos_mesh_mcp.tools.validation import check_chaos_components
+
+    async def slow_execute(self, command):
+        await asyncio.sleep(0.05)
+        return {"items": []}
+
+    monkeypatch.setattr(KubectlRunner, "_execute", slow_execute)
+    kubectl._get_command_cache.clear()
+
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(check_chaos_components(), 0.001))
+        result = asyncio.run(check_chaos_components())
+    finally:
+        kubectl._get_command_cache.clear()
+
+    assert "components" in result
@@ -0,0 +1,57 @@
+"""Tests for PhysicalMachineChaos tools."""
+
+import pytest
+import yaml
+
+from chaos_mesh_mcp.kubectl import KubectlError, KubectlRunner
+from chaos_mesh_mcp.tools.physical import create_physical_stress_cpu
+
+
+ADDRESSES = ["1.1.1.1", "2.2.2.2", "3.3.3.3"]
+
+
+@pytest.fixture
+def fake_kubectl(monkeypatch):
+    """Record applies and commands; applies targeting 2.2.2.2 fail."""
+    calls = {"applied": [], "commands": []}
+
+    async def apply_yaml(self, yaml_content, namespace="default"):
+        doc = yaml.safe_load(yaml_content)
+        if doc["spec"]["address"] == ["2.2.2.2"]:
+            raise KubectlError("kubectl apply failed: unreachable")
+        calls["applied"].append(doc["metadata"]["name"])
+        return {"status": "applied", "output": doc["metadata"]["name"]}
+
+    async def run_command(self, command):
+        calls["commands"].append(command)
+        return {"output": ""}
+
+    monkeypatch.setattr(KubectlRunner, "apply_yaml", apply_yaml)
+    monkeypatch.setattr(KubectlRunner, "run_command", run_command)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_single_resource_by_default(fake_kubectl):
+    """Test that several addresses share one resource unless fan_out is set."""
+    result = await create_physical_stress_cpu(
+        namespace="default", duration="60s", address=["1.1.1.1", "3.3.3.3"], mode="all"
+    )
+
+    assert result.experiment_ids == [result.experiment_id]
+    assert fake_kubectl["applied"] == [result.experiment_id]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_failure_deletes_created_resources(fake_kubectl):
+    """Test that a failed per-address apply removes its siblings."""
+    with pytest.raises(KubectlError, match="unreachable"):
+        await create_physical_stress_cpu(
+            namespace="default", duration="60s", address=ADDRESSES, mode="all", fan_out=True
+        )
+
+    created = sorted(fake_kubectl["applied"])
+    assert [name[-2:] for name in created] == ["-0", "-2"]
+    assert sorted(fake_kubectl["commands"]) == [
+        f"delete physicalmachinechaos {name} -n default --ignore-not-found" for name in created
+    ]
@@ -0,0 +1,20 @@
+"""Tests for PodChaos tools."""
+
+import pytest
+
+from chaos_mesh_mcp.tools.pod import create_container_kill, create_pod_kill
+
+
+@pytest.mark.asyncio
+async def test_pre_validated_still_checks_bounds():
+    """Test that pre_validated skips format validators but not basic checks."""
+    with pytest.raises(ValueError, match="container_names cannot be empty"):
+        await create_container_kill(
+            namespace="default", target_labels={"app": "web"}, container_names=[],
+            duration="60s", skip_target_check=True, pre_validated=True
+        )
+    with pytest.raises(ValueError, match="Grace period must be >= 0"):
+        await create_pod_kill(
+            namespace="default", target_labels={"app": "web"}, duration="60s",
+            grace_period=-1, skip_target_check=True, pre_validated=True
+        )
@@ -0,0 +1,25 @@
+"""Tests for StressChaos tools."""
+
+import pytest
+
+from chaos_mesh_mcp.tools.stress import create_stress_cpu, create_stress_memory
+
+
+@pytest.mark.asyncio
+async def test_pre_validated_still_checks_bounds():
+    """Test that pre_validated skips format validators but not bounds checks."""
+    with pytest.raises(ValueError, match="CPU workers must be 1-16"):
+        await create_stress_cpu(
+            namespace="default", target_labels={"app": "web"}, workers=0,
+            duration="60s", skip_target_check=True, pre_validated=True
+        )
+    with pytest.raises(ValueError, match="CPU load must be 0-100"):
+        await create_stress_cpu(
+            namespace="default", target_labels={"app": "web"}, workers=1, load=150,
+            duration="60s", skip_target_check=True, pre_validated=True
+        )
+    with pytest.raises(ValueError, match="Memory workers must be 1-8"):
+        await create_stress_memory(
+            namespace="default", target_labels={"app": "web"}, size="256MB",
+            duration="60s", workers=9, skip_target_check=True, pre_validated=True
+        )
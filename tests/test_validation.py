@@ -0,0 +1,16 @@
+"""Tests for environment validation tools."""
+
+from chaos_mesh_mcp.tools.validation import get_chaos_requirements
+
+
+def test_get_chaos_requirements_returns_copies():
+    """Test that mutating a result does not change later results."""
+    requirements = get_chaos_requirements("dns")
+    requirements["crd"] = "changed"
+    requirements["required_components"].append("extra")
+
+    fresh = get_chaos_requirements("DNS")
+    assert fresh["crd"] == "dnschaos.chaos-mesh.org"
+    assert "extra" not in fresh["required_components"]
+
+    assert "error" in get_chaos_requirements("unknown")
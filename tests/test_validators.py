@@ -3,10 +3,16 @@
 import pytest
 from chaos_mesh_mcp.validators import (
     validate_duration,
+    validate_durations,
     validate_percentage,
+    validate_percentages,
     validate_memory_size,
+    validate_memory_sizes,
+    validate_bandwidth,
     validate_mode,
     validate_direction,
+    validate_labels,
+    validate_spec,
     ValidationError
 )
 
@@ -28,6 +34,17 @@ def test_validate_duration():
         validate_duration("10seconds")
 
 
+def test_validate_durations():
+    """Test batch duration validation."""
+    # Valid
+    validate_durations("10ms", "60s", "10ms")
+    validate_durations()
+
+    # Invalid values are all reported
+    with pytest.raises(ValidationError, match="'invalid', '10'"):
+        validate_durations("1s", "invalid", "10")
+
+
 def test_validate_percentage():
     """Test percentage validation."""
     # Valid
@@ -45,22 +62,62 @@ def test_validate_percentage():
         validate_percentage("abc")
 
 
+def test_validate_percentages():
+    """Test batch percentage validation."""
+    # Valid
+    validate_percentages("0", "50.5", "100")
+
+    # Invalid
+    with pytest.raises(ValidationError, match="'101', 'abc'"):
+        validate_percentages("50", "101", "abc")
+
+
 def test_validate_memory_size():
     """Test memory size validation."""
     # Valid
     validate_memory_size("256MB")
     validate_memory_size("1GB")
     validate_memory_size("512KB")
+    validate_memory_size("256mb")
+    validate_memory_size("1TB")
 
     # Invalid
     with pytest.raises(ValidationError):
         validate_memory_size("256")
     with pytest.raises(ValidationError):
-        validate_memory_size("1TB")  # Not supported
+        validate_memory_size("1PB")  # Not supported
     with pytest.raises(ValidationError):
         validate_memory_size("invalid")
 
 
+def test_validate_memory_sizes():
+    """Test batch memory size validation."""
+    # Valid
+    validate_memory_sizes("256MB", "1GB")
+
+    # Invalid
+    with pytest.raises(ValidationError, match="'256', 'invalid'"):
+        validate_memory_sizes("256", "1GB", "invalid")
+
+
+def test_validate_bandwidth():
+    """Test bandwidth validation."""
+    # Valid
+    validate_bandwidth("1mbit")
+    validate_bandwidth("100kbps")
+    validate_bandwidth("10bit")
+    validate_bandwidth("1Gbit")
+    validate_bandwidth("100KBPS")
+
+    # Invalid
+    with pytest.raises(ValidationError):
+        validate_bandwidth("100")
+    with pytest.raises(ValidationError):
+        validate_bandwidth("mbit")
+    with pytest.raises(ValidationError):
+        validate_bandwidth("10mb")
+
+
 def test_validate_mode():
     """Test mode validation."""
     # Valid
@@ -68,10 +125,13 @@ def test_validate_mode():
     validate_mode("all")
     validate_mode("fixed")
     validate_mode("fixed-percent")
+    validate_mode("-".join(["fixed", "percent"]))
 
     # Invalid
     with pytest.raises(ValidationError):
         validate_mode("invalid")
+    with pytest.raises(ValidationError):
+        validate_mode(["all"])
 
 
 def test_validate_direction():
@@ -84,3 +144,49 @@ def test_validate_direction():
     # Invalid
     with pytest.raises(ValidationError):
         validate_direction("invalid")
+    with pytest.raises(ValidationError):
+        validate_direction(None)
+
+
+def test_validate_labels():
+    """Test label selector validation."""
+    # Valid
+    validate_labels({"app": "web"})
+    validate_labels({"app": "web", "tier": "frontend", "app.example.com": ""})
+
+    # Invalid
+    with pytest.raises(ValidationError, match="cannot be empty"):
+        validate_labels({})
+    with pytest.raises(ValidationError, match="Invalid label key: 'App'"):
+        validate_labels({"app": "web", "App": "web"})
+    with pytest.raises(ValidationError, match="Invalid label key"):
+        validate_labels({"app-": "web"})
+    with pytest.raises(ValidationError, match="Invalid label key"):
+        validate_labels({"app\0tier": "web"})
+    with pytest.raises(ValidationError, match="Invalid label key"):
+        validate_labels({"app-.example.com": "web"})
+    with pytest.raises(ValidationError, match="Invalid label key"):
+        validate_labels({"app\n": "web"})
+    with pytest.raises(ValidationError, match="Label value must be string"):
+        validate_labels({"app": 1})
+
+
+def test_validate_spec():
+    """Test multi-field spec validation."""
+    # Valid; unknown fields are ignored
+    validate_spec({
+        "target_labels": {"app": "web"},
+        "latency": "800ms",
+        "duration": "60s",
+        "correlation": "25",
+        "mode": "all",
+        "direction": "to",
+        "external_targets": ["1.1.1.1"],
+    })
+    validate_spec({})
+
+    # Invalid; every error is reported in spec order
+    with pytest.raises(ValidationError, match="^Invalid duration format: 'x'.*; Invalid mode: 'bad'"):
+        validate_spec({"duration": "x", "direction": "to", "mode": "bad"})
+    with pytest.raises(ValidationError, match="Percentage must be 0-100, got 200"):
+        validate_spec({"loss": "200"})